@@ -11,6 +11,7 @@ import time
 
 import trimesh
 from flask import Response, make_response, send_file
+from trimesh.exchange.stl import export_stl
 
 
 def mesh_to_stl_bytes(mesh: trimesh.Trimesh) -> tuple[bytes, int]:
@@ -24,10 +25,9 @@ def mesh_to_stl_bytes(mesh: trimesh.Trimesh) -> tuple[bytes, int]:
         Tuple of (binary STL data, export time in milliseconds)
     """
     t0 = time.time()
-    stl_io = io.BytesIO()
-    mesh.export(stl_io, file_type='stl')
-    stl_io.seek(0)
-    stl_bytes = stl_io.getvalue()
+    # Pack face normals and triangles straight into binary STL's float32 records,
+    # skipping the extra copies of exporting through a BytesIO
+    stl_bytes = export_stl(mesh)
     compute_ms = int((time.time() - t0) * 1000)
     return stl_bytes, compute_ms
 
@@ -40,9 +40,10 @@ def compute_etag(stl_bytes: bytes) -> str:
         stl_bytes: Binary STL data
 
     Returns:
-        SHA-256 hash as ETag
+        128-bit BLAKE2b hex digest as ETag (opaque to clients; collision
+        resistance is ample for cache validation)
     """
-    return hashlib.sha256(stl_bytes).hexdigest()
+    return hashlib.blake2b(stl_bytes, digest_size=16).hexdigest()
 
 
 def create_stl_response(
@@ -107,6 +107,68 @@ def _heal_watertight(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
     return mesh
 
 
+def _to_manifold(mesh: trimesh.Trimesh):
+    """Convert a trimesh mesh to a manifold3d Manifold, raising if manifold3d rejects it."""
+    import numpy as np
+    from manifold3d import Error, Manifold, Mesh
+
+    manifold = Manifold(
+        mesh=Mesh(
+            vert_properties=np.asarray(mesh.vertices, dtype=np.float32),
+            tri_verts=np.asarray(mesh.faces, dtype=np.uint32),
+        )
+    )
+    status = manifold.status()
+    if status != Error.NoError:
+        raise ValueError(f'manifold3d rejected input mesh: {status}')
+    # The status check accepts inside-out meshes; reject them like trimesh's is_volume check
+    if manifold.volume() <= 0:
+        raise ValueError('input mesh is not a positive volume')
+    return manifold
+
+
+def _manifold_boolean(mesh_list: list[trimesh.Trimesh], operation: str) -> trimesh.Trimesh:
+    """
+    Run a boolean directly through manifold3d's BatchBoolean.
+
+    Each input is converted once and the whole operation is evaluated in a single
+    batch call (for difference, every tail mesh is subtracted from the head), then
+    converted back once. Instead of trimesh's per-input is_volume check, inputs that
+    manifold3d rejects or that are not positive volumes (e.g. inside out) raise
+    ValueError so the caller's engine fallbacks still run.
+    """
+    from manifold3d import Manifold, OpType
+
+    op = {'union': OpType.Add, 'difference': OpType.Subtract}[operation]
+    result = Manifold.batch_boolean([_to_manifold(m) for m in mesh_list], op).to_mesh()
+    mesh = trimesh.Trimesh(vertices=result.vert_properties, faces=result.tri_verts, process=False)
+    mesh.metadata['boolean_engine'] = 'manifold'
+    return mesh
+
+
+def is_manifold_result(mesh: trimesh.Trimesh) -> bool:
+    """
+    Return True when the mesh came straight out of manifold3d.
+
+    Manifold output is closed and consistently wound by construction, so callers can
+    skip the O(E) is_watertight check and hole filling for these meshes.
+    """
+    return mesh.metadata.get('boolean_engine') == 'manifold'
+
+
+def _union_with_engines(mesh_list: list[trimesh.Trimesh], engine_preference: str | None = None) -> trimesh.Trimesh:
+    """Union with each candidate engine in turn; raises RuntimeError if every engine fails."""
+    for engine in _candidate_engines(engine_preference):
+        try:
+            logger.debug(f'mesh_union trying engine={engine or "trimesh-default"} for {len(mesh_list)} meshes')
+            if engine == 'manifold':
+                return _manifold_boolean(mesh_list, 'union')
+            return trimesh.boolean.union(mesh_list, engine=engine)
+        except Exception as e:
+            logger.warning(f'mesh_union engine {engine or "trimesh-default"} failed: {e}')
+    raise RuntimeError(f'every boolean engine failed to union {len(mesh_list)} meshes')
+
+
 def mesh_union(meshes: Iterable[trimesh.Trimesh], engine_preference: str | None = None) -> trimesh.Trimesh:
     """Robust union with fallback engines and pairwise batching."""
     mesh_list = [m for m in meshes if m is not None]
@@ -115,12 +177,10 @@ def mesh_union(meshes: Iterable[trimesh.Trimesh], engine_preference: str | None
     if len(mesh_list) == 1:
         return mesh_list[0]
 
-    for engine in _candidate_engines(engine_preference):
-        try:
-            logger.debug(f'mesh_union trying engine={engine or "trimesh-default"} for {len(mesh_list)} meshes')
-            return trimesh.boolean.union(mesh_list, engine=engine)
-        except Exception as e:
-            logger.warning(f'mesh_union engine {engine or "trimesh-default"} failed: {e}')
+    try:
+        return _union_with_engines(mesh_list, engine_preference)
+    except RuntimeError:
+        pass
 
     # Pairwise union fallback (binary tree) using trimesh default
     try:
@@ -146,6 +206,39 @@ def mesh_union(meshes: Iterable[trimesh.Trimesh], engine_preference: str | None
         return trimesh.util.concatenate(mesh_list)
 
 
+def pairwise_union(meshes: Iterable[trimesh.Trimesh]) -> list[trimesh.Trimesh]:
+    """
+    Union cutting tools in a balanced binary tree, for the one-at-a-time subtraction fallbacks.
+
+    Each level unions neighbouring pairs, so N tools collapse into a few groups after
+    log2(N) levels instead of N differences against an ever-growing base. A pair that
+    no engine can union is kept as two separate tools (never concatenated), so one bad
+    tool only costs its own subtraction.
+
+    Returns:
+        List of tools to subtract; a single mesh when every union succeeds
+    """
+    work = [m for m in meshes if m is not None]
+    while len(work) > 1:
+        next_level: list[trimesh.Trimesh] = []
+        merged = False
+        it = iter(work)
+        for a, b in itertools.zip_longest(it, it):
+            if b is None:
+                next_level.append(a)
+                continue
+            try:
+                next_level.append(_union_with_engines([a, b]))
+                merged = True
+            except RuntimeError as e:
+                logger.warning(f'pairwise union kept tools separate: {e}')
+                next_level.extend([a, b])
+        work = next_level
+        if not merged:
+            break
+    return work
+
+
 def mesh_difference(meshes: Iterable[trimesh.Trimesh], engine_preference: str | None = None) -> trimesh.Trimesh:
     """Robust difference [base, tool] or [base, union(tool...)] with fallbacks."""
     mesh_list = [m for m in meshes if m is not None]
@@ -158,6 +251,9 @@ def mesh_difference(meshes: Iterable[trimesh.Trimesh], engine_preference: str |
     for engine in _candidate_engines(engine_preference):
         try:
             logger.debug(f'mesh_difference trying engine={engine or "trimesh-default"} with {1 + len(cutters)} meshes')
+            if engine == 'manifold':
+                # Watertight by construction; no healing pass needed
+                return _manifold_boolean([base] + cutters, 'difference')
             result = trimesh.boolean.difference([base] + cutters, engine=engine)
             return _heal_watertight(result)
         except Exception as e:
@@ -177,61 +273,3 @@ def mesh_difference(meshes: Iterable[trimesh.Trimesh], engine_preference: str |
         logger.error(f'mesh_difference fallback failed: {e}')
         # As a very last resort, return the base unmodified to avoid crashes
         return base
-
-
-def batch_union(
-    meshes: Iterable[trimesh.Trimesh],
-    batch_size: int = 32,
-    engine_preference: str | None = None,
-) -> trimesh.Trimesh:
-    """Union meshes in batches to reduce complexity and improve robustness."""
-    mesh_list = [m for m in meshes if m is not None]
-    if not mesh_list:
-        raise ValueError('batch_union() requires at least one mesh')
-    if len(mesh_list) == 1:
-        return mesh_list[0]
-
-    if batch_size <= 1:
-        return mesh_union(mesh_list, engine_preference)
-
-    buckets: list[trimesh.Trimesh] = []
-    for i in range(0, len(mesh_list), batch_size):
-        bucket = mesh_union(mesh_list[i : i + batch_size], engine_preference)
-        buckets.append(bucket)
-    return mesh_union(buckets, engine_preference)
-
-
-def batch_subtract(
-    base: trimesh.Trimesh,
-    cutters: Iterable[trimesh.Trimesh],
-    engine_preference: str | None = None,
-    union_first: bool = True,
-    union_batch_size: int = 64,
-) -> trimesh.Trimesh:
-    """Subtract many cutters from base with optional pre-union for robustness."""
-    cutter_list = [c for c in cutters if c is not None]
-    if not cutter_list:
-        return base
-
-    if union_first:
-        try:
-            union_cutters = batch_union(cutter_list, batch_size=union_batch_size, engine_preference=engine_preference)
-            return mesh_difference([base, union_cutters], engine_preference)
-        except Exception as e:
-            logger.warning(f'batch_subtract union-first path failed: {e}')
-
-    # Fallback: subtract individually
-    try:
-        result = base.copy()
-        for i, cutter in enumerate(cutter_list):
-            try:
-                result = mesh_difference([result, cutter], engine_preference)
-            except Exception as e_single:
-                logger.warning(
-                    f'batch_subtract individual difference failed on cutter {i + 1}/{len(cutter_list)}: {e_single}'
-                )
-                continue
-        return result
-    except Exception as e:
-        logger.error(f'batch_subtract fallback failed: {e}')
-        return base
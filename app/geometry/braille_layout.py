@@ -6,16 +6,48 @@ This module contains functions for creating 2D and 3D marker shapes
 functions for character rendering.
 """
 
+import logging
+from functools import lru_cache
+from types import SimpleNamespace
+
+import numpy as np
 import trimesh
 from shapely.geometry import Polygon
 from shapely.ops import unary_union
 
 from app.models import CardSettings
-from app.utils import get_logger
+from app.utils import BRAILLE_UNICODE_END, BRAILLE_UNICODE_START, braille_to_dots, get_logger
 
 logger = get_logger(__name__)
 
 
+def braille_dot_mask(braille_text: str) -> np.ndarray:
+    """
+    Decode a run of braille characters into their raised dots in one vectorized pass.
+
+    The low six bits of a braille code point (offset from U+2800) are dots 1-6, so the
+    mask comes straight from the code points. Spaces decode as blank cells.
+
+    Args:
+        braille_text: Braille Unicode string (one character per cell)
+
+    Returns:
+        (len(braille_text), 6) boolean array in dot 1-6 order
+
+    Raises:
+        ValueError: If any character is outside the braille Unicode block (same as braille_to_dots)
+    """
+    # Code points via a single utf-32 buffer view instead of ord() per character
+    codes = np.frombuffer(braille_text.encode('utf-32-le'), dtype='<u4').astype(np.int64)
+    blank = codes == ord(' ')
+    invalid = ~blank & ((codes < BRAILLE_UNICODE_START) | (codes > BRAILLE_UNICODE_END))
+    if invalid.any():
+        # Reuse the scalar decoder so the error message stays identical
+        braille_to_dots(braille_text[int(np.argmax(invalid))])
+    patterns = np.where(blank, 0, codes - BRAILLE_UNICODE_START)
+    return ((patterns[:, None] >> np.arange(6)) & 1).astype(bool)
+
+
 def create_triangle_marker_polygon(x, y, settings: CardSettings):
     """
     Create a 2D triangle polygon for the first cell of each braille row.
@@ -30,22 +62,20 @@ def create_triangle_marker_polygon(x, y, settings: CardSettings):
     Returns:
         Shapely Polygon representing the triangle
     """
-    # Calculate triangle dimensions based on braille dot spacing
-    # Base height = distance from top to bottom dot = 2 * dot_spacing
-    2 * settings.dot_spacing
-
-    # Triangle height (horizontal extension) = dot_spacing (to reach middle-right dot)
-    triangle_width = settings.dot_spacing
+    # Triangle dimensions are based on braille dot spacing:
+    # base height = distance from top to bottom dot = 2 * dot_spacing,
+    # triangle height (horizontal extension) = dot_spacing (to reach middle-right dot)
+    ds = settings.dot_spacing
 
     # Triangle vertices:
     # Base is centered between top-left and bottom-left dots
-    base_x = x - settings.dot_spacing / 2  # Left column position
+    base_x = x - ds / 2  # Left column position
 
     # Create triangle vertices
     vertices = [
-        (base_x, y - settings.dot_spacing),  # Bottom of base
-        (base_x, y + settings.dot_spacing),  # Top of base
-        (base_x + triangle_width, y),  # Apex (at middle-right dot height)
+        (base_x, y - ds),  # Bottom of base
+        (base_x, y + ds),  # Top of base
+        (base_x + ds, y),  # Apex (at middle-right dot height)
     ]
 
     # Create and return the triangle polygon
@@ -67,13 +97,15 @@ def create_line_marker_polygon(x, y, settings: CardSettings):
     Returns:
         Shapely Polygon representing the rectangle
     """
-    line_width = settings.dot_spacing
-    line_x = x + settings.dot_spacing / 2
+    # Width equals one dot spacing, centered on the right column (x + ds/2)
+    ds = settings.dot_spacing
+    ds_half = ds / 2
+    line_x = x + ds_half
     vertices = [
-        (line_x - line_width / 2, y - settings.dot_spacing),  # Bottom left
-        (line_x + line_width / 2, y - settings.dot_spacing),  # Bottom right
-        (line_x + line_width / 2, y + settings.dot_spacing),  # Top right
-        (line_x - line_width / 2, y + settings.dot_spacing),  # Top left
+        (line_x - ds_half, y - ds),  # Bottom left
+        (line_x + ds_half, y - ds),  # Bottom right
+        (line_x + ds_half, y + ds),  # Top right
+        (line_x - ds_half, y + ds),  # Top left
     ]
     return Polygon(vertices)
 
@@ -83,21 +115,45 @@ def _build_character_polygon(char_upper: str, target_width: float, target_height
     Build a 2D character outline as a shapely polygon, scaled to fit within
     the provided target width/height, centered at origin. Uses matplotlib if
     available; returns None on failure so callers can fall back gracefully.
+
+    Results are memoized per (character, size) since every row of a plate asks
+    for the same few glyphs. Shapely geometries are immutable, so callers can
+    safely translate the shared result.
+    """
+    return _build_character_polygon_cached(char_upper, round(float(target_width), 3), round(float(target_height), 3))
+
+
+@lru_cache(maxsize=1)
+def _character_font_prop():
+    """
+    Resolve the marker font once per process.
+
+    The FontProperties is pinned to the file matplotlib's findfont picks (including its
+    default-font fallback), so later TextPath calls skip the font lookup entirely.
     """
+    from matplotlib.font_manager import FontProperties, findfont  # type: ignore
+
+    # Preferred tactile-friendly font with robust fallback
+    try:
+        font_prop = FontProperties(family='Arial Rounded MT Bold', weight='bold')
+    except Exception:
+        font_prop = FontProperties(family='monospace', weight='bold')
+    font_prop.set_file(findfont(font_prop))
+    return font_prop
+
+
+@lru_cache(maxsize=256)
+def _build_character_polygon_cached(char_upper: str, target_width: float, target_height: float):
+    """Uncached worker for _build_character_polygon (sizes pre-rounded for cache hits)."""
     try:
         # Lazy import to keep serverless light
         try:
-            from matplotlib.font_manager import FontProperties  # type: ignore
             from matplotlib.path import Path  # type: ignore
             from matplotlib.textpath import TextPath  # type: ignore
         except Exception:
             return None
 
-        # Preferred tactile-friendly font with robust fallback
-        try:
-            font_prop = FontProperties(family='Arial Rounded MT Bold', weight='bold')
-        except Exception:
-            font_prop = FontProperties(family='monospace', weight='bold')
+        font_prop = _character_font_prop()
 
         # Matplotlib expects points; approximate 1 mm ≈ 2.835 pt
         font_size = max(target_height, target_width) * 2.835
@@ -106,37 +162,17 @@ def _build_character_polygon(char_upper: str, target_width: float, target_height
         vertices = text_path.vertices
         codes = text_path.codes
 
-        # Convert matplotlib path codes to polygons
-        polygons = []
-        current_polygon = []
-        i = 0
-        while i < len(codes):
-            code = codes[i]
-            if code == Path.MOVETO:
-                if current_polygon and len(current_polygon) >= 3:
-                    polygons.append(Polygon(current_polygon))
-                current_polygon = [tuple(vertices[i])]
-            elif code == Path.LINETO:
-                current_polygon.append(tuple(vertices[i]))
-            elif code == Path.CURVE3:
-                if i + 1 < len(codes):
-                    current_polygon.append(tuple(vertices[i]))
-                    current_polygon.append(tuple(vertices[i + 1]))
-                    i += 1
-            elif code == Path.CURVE4:
-                if i + 2 < len(codes):
-                    current_polygon.append(tuple(vertices[i]))
-                    current_polygon.append(tuple(vertices[i + 1]))
-                    current_polygon.append(tuple(vertices[i + 2]))
-                    i += 2
-            elif code == Path.CLOSEPOLY:
-                if current_polygon and len(current_polygon) >= 3:
-                    polygons.append(Polygon(current_polygon))
-                current_polygon = []
-            i += 1
-
-        if current_polygon and len(current_polygon) >= 3:
-            polygons.append(Polygon(current_polygon))
+        if codes is None:
+            return None
+
+        # Convert matplotlib path codes to polygons: MOVETO and CLOSEPOLY end the
+        # current contour, and curve control points are kept as outline vertices.
+        codes = np.asarray(codes)
+        contour_break = (codes == Path.MOVETO) | (codes == Path.CLOSEPOLY)
+        keep = (codes != Path.CLOSEPOLY) & (codes != Path.STOP)
+        contour_ids = np.cumsum(contour_break)[keep]
+        contours = np.split(np.asarray(vertices)[keep], np.flatnonzero(np.diff(contour_ids)) + 1)
+        polygons = [Polygon(contour) for contour in contours if len(contour) >= 3]
         if not polygons:
             return None
 
@@ -183,11 +219,12 @@ def create_character_shape_polygon(character, x, y, settings: CardSettings):
         Shapely Polygon representing the character, or None if character cannot be created
     """
     # Define character size (same as in create_character_shape_3d)
-    char_height = 2 * settings.dot_spacing + 4.375  # 9.375mm for default 2.5mm dot spacing
-    char_width = settings.dot_spacing * 0.8 + 2.6875  # 4.6875mm for default 2.5mm dot spacing
+    ds = settings.dot_spacing
+    char_height = 2 * ds + 4.375  # 9.375mm for default 2.5mm dot spacing
+    char_width = ds * 0.8 + 2.6875  # 4.6875mm for default 2.5mm dot spacing
 
     # Position character at the right column of the cell
-    char_x = x + settings.dot_spacing / 2
+    char_x = x + ds / 2
     char_y = y
 
     # Get the character definition
@@ -213,6 +250,37 @@ def create_character_shape_polygon(character, x, y, settings: CardSettings):
         return create_line_marker_polygon(x, y, settings)
 
 
+def _marker_outline(kind, ds):
+    """Return the triangle or line marker outline for a cell centered at the origin."""
+    # The 2D marker helpers only read dot_spacing, so a stand-in carries the cached spacing
+    spacing = SimpleNamespace(dot_spacing=ds)
+    if kind == 'triangle':
+        return create_triangle_marker_polygon(0.0, 0.0, spacing)
+    return create_line_marker_polygon(0.0, 0.0, spacing)
+
+
+@lru_cache(maxsize=32)
+def _marker_prism_cached(kind, ds, height, for_subtraction):
+    """
+    Extrude a marker outline once per (kind, dot spacing, height, mode).
+
+    The prism sits on z=0 with its cell center at the origin. The mesh is shared,
+    so callers must copy it before translating.
+    """
+    # Subtraction tools get extra depth to ensure a clean boolean
+    extrude_height = height + 0.5 if for_subtraction else height
+    return trimesh.creation.extrude_polygon(_marker_outline(kind, ds), height=extrude_height)
+
+
+def _place_marker_prism(kind, x, y, settings: CardSettings, height, for_subtraction):
+    """Copy the cached marker prism and move it to (x, y) on the card surface."""
+    prism = _marker_prism_cached(kind, round(settings.dot_spacing, 4), round(height, 4), for_subtraction).copy()
+    # Subtraction tools start slightly above the surface; raised markers sit on top of the card
+    z_pos = settings.card_thickness - 0.1 if for_subtraction else settings.card_thickness
+    prism.apply_translation([x, y, z_pos])
+    return prism
+
+
 def create_card_triangle_marker_3d(x, y, settings: CardSettings, height=0.6, for_subtraction=False):
     """
     Create a 3D triangular prism for card surface marking.
@@ -226,40 +294,7 @@ def create_card_triangle_marker_3d(x, y, settings: CardSettings, height=0.6, for
     Returns:
         Trimesh object representing the 3D triangle marker
     """
-    # Calculate triangle dimensions based on braille dot spacing
-    2 * settings.dot_spacing
-    triangle_width = settings.dot_spacing
-
-    # Triangle vertices (same as 2D version)
-    base_x = x - settings.dot_spacing / 2  # Left column position
-
-    vertices = [
-        (base_x, y - settings.dot_spacing),  # Bottom of base
-        (base_x, y + settings.dot_spacing),  # Top of base
-        (base_x + triangle_width, y),  # Apex (at middle-right dot height)
-    ]
-
-    # Create 2D polygon using Shapely
-    tri_2d = Polygon(vertices)
-
-    if for_subtraction:
-        # For counter plate recesses, extrude downward from top surface
-        # Create a prism that extends from above the surface into the plate
-        extrude_height = height + 0.5  # Extra depth to ensure clean boolean
-        tri_prism = trimesh.creation.extrude_polygon(tri_2d, height=extrude_height)
-
-        # Position at the top surface of the card
-        z_pos = settings.card_thickness - 0.1  # Start slightly above surface
-        tri_prism.apply_translation([0, 0, z_pos])
-    else:
-        # For embossing plate, extrude upward from top surface
-        tri_prism = trimesh.creation.extrude_polygon(tri_2d, height=height)
-
-        # Position on top of the card base
-        z_pos = settings.card_thickness
-        tri_prism.apply_translation([0, 0, z_pos])
-
-    return tri_prism
+    return _place_marker_prism('triangle', x, y, settings, height, for_subtraction)
 
 
 def create_card_line_end_marker_3d(x, y, settings: CardSettings, height=0.5, for_subtraction=False):
@@ -275,43 +310,34 @@ def create_card_line_end_marker_3d(x, y, settings: CardSettings, height=0.5, for
     Returns:
         Trimesh object representing the 3D line marker
     """
-    # Calculate line dimensions based on braille dot spacing
-    2 * settings.dot_spacing  # Vertical extent (same as cell height)
-    line_width = settings.dot_spacing  # Horizontal extent
+    return _place_marker_prism('line', x, y, settings, height, for_subtraction)
 
-    # Position line at the right column of the cell
-    # The line should be centered on the right column dot positions
-    line_x = x + settings.dot_spacing / 2  # Right column position
-
-    # Create rectangle vertices
-    vertices = [
-        (line_x - line_width / 2, y - settings.dot_spacing),  # Bottom left
-        (line_x + line_width / 2, y - settings.dot_spacing),  # Bottom right
-        (line_x + line_width / 2, y + settings.dot_spacing),  # Top right
-        (line_x - line_width / 2, y + settings.dot_spacing),  # Top left
-    ]
 
-    # Create 2D polygon using Shapely
-    line_2d = Polygon(vertices)
+@lru_cache(maxsize=64)
+def _character_prism_cached(char_upper, char_width, char_height, height, for_subtraction):
+    """
+    Extrude a character outline centered at the origin, or return None if it is unusable.
 
-    if for_subtraction:
-        # For counter plate recesses, extrude downward from top surface
-        # Create a prism that extends from above the surface into the plate
-        extrude_height = height + 0.5  # Extra depth to ensure clean boolean
-        line_prism = trimesh.creation.extrude_polygon(line_2d, height=extrude_height)
+    Cached per (character, size, height, mode); the mesh is shared, so callers must
+    copy it before translating.
+    """
+    char_2d = _build_character_polygon(char_upper, char_width, char_height)
+    # Extruding a valid, non-empty polygon yields a closed volume, so the outline is
+    # checked here instead of repairing the mesh afterwards
+    if char_2d is None or char_2d.is_empty or not char_2d.is_valid:
+        return None
 
-        # Position at the top surface of the card
-        z_pos = settings.card_thickness - 0.1  # Start slightly above surface
-        line_prism.apply_translation([0, 0, z_pos])
-    else:
-        # For embossing plate, extrude upward from top surface
-        line_prism = trimesh.creation.extrude_polygon(line_2d, height=height)
+    try:
+        # Extra depth for subtraction tools to ensure a clean boolean
+        char_prism = trimesh.creation.extrude_polygon(char_2d, height=height + 0.5 if for_subtraction else height)
+    except Exception as e:
+        logger.warning(f'Failed to extrude character shape: {e}')
+        return None
 
-        # Position on top of the card base
-        z_pos = settings.card_thickness
-        line_prism.apply_translation([0, 0, z_pos])
+    if logger.isEnabledFor(logging.DEBUG) and not char_prism.is_volume:
+        logger.debug("Character mesh for '%s' is not a valid volume", char_upper)
 
-    return line_prism
+    return char_prism
 
 
 def create_character_shape_3d(character, x, y, settings: CardSettings, height=1.0, for_subtraction=True):
@@ -332,11 +358,12 @@ def create_character_shape_3d(character, x, y, settings: CardSettings, height=1.
     # Debug: character marker generation
 
     # Define character size based on braille cell dimensions (scaled 56.25% bigger than original)
-    char_height = 2 * settings.dot_spacing + 4.375  # 9.375mm for default 2.5mm dot spacing
-    char_width = settings.dot_spacing * 0.8 + 2.6875  # 4.6875mm for default 2.5mm dot spacing
+    ds = settings.dot_spacing
+    char_height = 2 * ds + 4.375  # 9.375mm for default 2.5mm dot spacing
+    char_width = ds * 0.8 + 2.6875  # 4.6875mm for default 2.5mm dot spacing
 
     # Position character at the right column of the cell
-    char_x = x + settings.dot_spacing / 2
+    char_x = x + ds / 2
     char_y = y
 
     # Get the character definition
@@ -346,48 +373,21 @@ def create_character_shape_3d(character, x, y, settings: CardSettings, height=1.
         return create_card_line_end_marker_3d(x, y, settings, height, for_subtraction)
 
     try:
-        # Build character polygon using shared helper (handles matplotlib/lazy import)
-        char_2d = _build_character_polygon(char_upper, char_width, char_height)
-        if char_2d is None:
-            return create_card_line_end_marker_3d(x, y, settings, height, for_subtraction)
-
-        # Translate to desired position
-        from shapely import affinity as _affinity
-
-        char_2d = _affinity.translate(char_2d, xoff=char_x, yoff=char_y)
-
+        char_prism = _character_prism_cached(
+            char_upper, round(char_width, 3), round(char_height, 3), round(height, 4), for_subtraction
+        )
     except Exception as e:
         logger.warning(f'Failed to create character shape using matplotlib: {e}')
         logger.info('Falling back to rectangle marker')
         return create_card_line_end_marker_3d(x, y, settings, height, for_subtraction)
 
-    # Extrude to 3D
-    try:
-        if for_subtraction:
-            # For embossing plate recesses, extrude downward from top surface
-            extrude_height = height + 0.5  # Extra depth to ensure clean boolean
-            char_prism = trimesh.creation.extrude_polygon(char_2d, height=extrude_height)
-
-            # Ensure the mesh is valid
-            if not char_prism.is_volume:
-                char_prism.fix_normals()
-                if not char_prism.is_volume:
-                    logger.warning('Character mesh is not a valid volume')
-                    return create_card_line_end_marker_3d(x, y, settings, height, for_subtraction)
-
-            # Position at the top surface of the card
-            z_pos = settings.card_thickness - 0.1  # Start slightly above surface
-            char_prism.apply_translation([0, 0, z_pos])
-        else:
-            # For raised characters (if needed in future)
-            char_prism = trimesh.creation.extrude_polygon(char_2d, height=height)
-
-            # Position on top of the card base
-            z_pos = settings.card_thickness
-            char_prism.apply_translation([0, 0, z_pos])
-    except Exception as e:
-        logger.warning(f'Failed to extrude character shape: {e}')
+    if char_prism is None:
         return create_card_line_end_marker_3d(x, y, settings, height, for_subtraction)
 
+    char_prism = char_prism.copy()
+    # Subtraction tools start slightly above the surface; raised characters sit on top of the card
+    z_pos = settings.card_thickness - 0.1 if for_subtraction else settings.card_thickness
+    char_prism.apply_translation([char_x, char_y, z_pos])
+
     # Debug: character marker generated
     return char_prism
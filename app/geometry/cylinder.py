@@ -7,7 +7,9 @@ shell creation, dot mapping, and recess operations.
 
 from __future__ import annotations
 
+import math
 import os as _os
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -16,9 +18,10 @@ from shapely.geometry import Point as ShapelyPoint
 from shapely.geometry import Polygon as ShapelyPolygon
 from trimesh.creation import extrude_polygon
 
-from app.geometry.booleans import batch_union, has_boolean_backend, mesh_difference, mesh_union
-from app.geometry.dot_shapes import create_braille_dot
-from app.utils import braille_to_dots, get_logger
+from app.geometry.booleans import has_boolean_backend, is_manifold_result, mesh_difference, pairwise_union
+from app.geometry.braille_layout import braille_dot_mask
+from app.geometry.dot_shapes import braille_dot_template, cone_recess_template, instance_meshes
+from app.utils import get_logger, has_braille_chars
 
 if TYPE_CHECKING:
     from app.models import CardSettings
@@ -67,20 +70,80 @@ def _compute_cylinder_frame(x_arc: float, cylinder_diameter_mm: float, seam_offs
     Returns (r_hat, t_hat, z_hat, radius, circumference, theta).
     """
     radius = cylinder_diameter_mm / 2.0
+    circumference = math.pi * cylinder_diameter_mm
+    # Scalar trig through math avoids numpy's ufunc dispatch; arrays use _compute_cylinder_frames
+    theta = math.radians(seam_offset_deg) - (x_arc / circumference) * 2.0 * math.pi
+    cos_t = math.cos(theta)
+    sin_t = math.sin(theta)
+    r_hat = np.array([cos_t, sin_t, 0.0])
+    t_hat = np.array([-sin_t, cos_t, 0.0])
+    z_hat = np.array([0.0, 0.0, 1.0])
+    return r_hat, t_hat, z_hat, radius, circumference, theta
+
+
+@lru_cache(maxsize=64)
+def _column_frame(x_arc: float, cylinder_diameter_mm: float, seam_offset_deg: float = 0.0):
+    """
+    Cached _compute_cylinder_frame for marker columns.
+
+    Row markers share their column positions across every row, so each column's trig is
+    evaluated once. The returned vectors are read-only because they are shared.
+    """
+    frame = _compute_cylinder_frame(x_arc, cylinder_diameter_mm, seam_offset_deg)
+    for vector in frame[:3]:
+        vector.flags.writeable = False
+    return frame
+
+
+def _compute_cylinder_frames(x_arc: np.ndarray, cylinder_diameter_mm: float, seam_offset_deg: float = 0.0):
+    """
+    Batched _compute_cylinder_frame for an array of arc-length positions.
+    Returns (r_hat, t_hat, z_hat, radius, circumference, theta) where r_hat and
+    t_hat have shape (N, 3) and theta has shape (N,).
+    """
+    x_arc = np.asarray(x_arc, dtype=float)
+    radius = cylinder_diameter_mm / 2.0
     circumference = np.pi * cylinder_diameter_mm
     theta = np.radians(seam_offset_deg) - (x_arc / circumference) * 2.0 * np.pi
-    r_hat = np.array([np.cos(theta), np.sin(theta), 0.0])
-    t_hat = np.array([-np.sin(theta), np.cos(theta), 0.0])
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    zeros = np.zeros_like(theta)
+    r_hat = np.stack([cos_t, sin_t, zeros], axis=1)
+    t_hat = np.stack([-sin_t, cos_t, zeros], axis=1)
     z_hat = np.array([0.0, 0.0, 1.0])
     return r_hat, t_hat, z_hat, radius, circumference, theta
 
 
+def _cylinder_dot_offsets(settings: CardSettings, radius: float) -> np.ndarray:
+    """
+    Offsets of braille dots 1-6 from their cell center on the cylinder, as a (6, 2) array.
+
+    Column 0 is the arc-length offset (the dot column spacing is applied as an angle and
+    converted back to arc length); column 1 is the vertical offset, which stays linear.
+    """
+    dot_spacing_angle = settings.dot_spacing / radius  # Convert linear to angular
+    half_arc = (dot_spacing_angle / 2) * radius
+    ds = settings.dot_spacing
+    return np.array(
+        [
+            [-half_arc, ds],  # Dot 1
+            [-half_arc, 0.0],  # Dot 2
+            [-half_arc, -ds],  # Dot 3
+            [half_arc, ds],  # Dot 4
+            [half_arc, 0.0],  # Dot 5
+            [half_arc, -ds],  # Dot 6
+        ]
+    )
+
+
 def cylindrical_transform(x, y, z, cylinder_diameter_mm, seam_offset_deg=0):
     """
     Transform planar coordinates to cylindrical coordinates.
     x -> theta (angle around cylinder)
     y -> z (height on cylinder)
     z -> radial offset from cylinder surface
+
+    Accepts scalars or equally shaped numpy arrays (everything broadcasts).
     """
     radius = cylinder_diameter_mm / 2
     circumference = np.pi * cylinder_diameter_mm
@@ -88,18 +151,30 @@ def cylindrical_transform(x, y, z, cylinder_diameter_mm, seam_offset_deg=0):
     # Convert x position to angle
     theta = np.radians(seam_offset_deg) - (x / circumference) * 2 * np.pi
 
-    # Calculate cylindrical coordinates
-    cyl_x = radius * np.cos(theta)
-    cyl_y = radius * np.sin(theta)
+    # Cylindrical coordinates, with the radial offset (for dot height) applied
+    r_eff = radius + z
+    cyl_x = r_eff * np.cos(theta)
+    cyl_y = r_eff * np.sin(theta)
     cyl_z = y
 
-    # Apply radial offset (for dot height)
-    cyl_x += z * np.cos(theta)
-    cyl_y += z * np.sin(theta)
-
     return cyl_x, cyl_y, cyl_z
 
 
+def _row_center_ys(settings, cylinder_height_mm: float) -> np.ndarray:
+    """
+    Card-space Y of every grid row's center, with the braille content centered vertically.
+
+    The content spans from the top dot of the first row to the bottom dot of the last row:
+    (grid_rows - 1) * line_spacing between row centers plus one dot spacing above and below.
+    Returns a (grid_rows,) array including braille_y_adjust.
+    """
+    braille_content_height = (settings.grid_rows - 1) * settings.line_spacing + 2 * settings.dot_spacing
+    # Space above content = space below content; first row center sits one dot spacing below the top
+    space_above = (cylinder_height_mm - braille_content_height) / 2.0
+    first_row_center_y = cylinder_height_mm - space_above - settings.dot_spacing
+    return first_row_center_y - np.arange(settings.grid_rows) * settings.line_spacing + settings.braille_y_adjust
+
+
 def layout_cylindrical_cells(braille_lines, settings, cylinder_diameter_mm: float, cylinder_height_mm: float):
     """
     Calculate positions for braille cells on a cylinder surface.
@@ -129,9 +204,7 @@ def layout_cylindrical_cells(braille_lines, settings, cylinder_diameter_mm: floa
     cell_spacing_angle = settings.cell_spacing / radius
 
     # Calculate vertical centering
-    braille_content_height = (settings.grid_rows - 1) * settings.line_spacing + 2 * settings.dot_spacing
-    space_above = (cylinder_height_mm - braille_content_height) / 2.0
-    first_row_center_y = cylinder_height_mm - space_above - settings.dot_spacing
+    row_ys = _row_center_ys(settings, cylinder_height_mm).tolist()
 
     # Process up to grid_rows lines
     for row_num in range(min(settings.grid_rows, len(braille_lines))):
@@ -140,12 +213,10 @@ def layout_cylindrical_cells(braille_lines, settings, cylinder_diameter_mm: floa
             continue
 
         # Check if input contains proper braille Unicode
-        has_braille_chars = any(ord(char) >= 0x2800 and ord(char) <= 0x28FF for char in line)
-        if not has_braille_chars:
+        if not has_braille_chars(line):
             continue
 
-        # Calculate Y position for this row with vertical centering
-        y_pos = first_row_center_y - (row_num * settings.line_spacing) + settings.braille_y_adjust
+        y_pos = row_ys[row_num]
 
         # Process each character up to available columns.
         # The triangle alignment indicator always occupies column 0. When indicator
@@ -178,6 +249,17 @@ def create_cylinder_shell(
             Useful to align a cutout vertex with the triangle indicator column
             (including seam offset) on the cylinder surface.
     """
+    # The shell only depends on its dimensions, so repeat requests reuse the cached extrusion
+    return _cylinder_shell_cached(
+        diameter_mm, height_mm, polygonal_cutout_radius_mm, polygonal_cutout_sides, align_vertex_theta_rad
+    ).copy()
+
+
+@lru_cache(maxsize=16)
+def _cylinder_shell_cached(
+    diameter_mm, height_mm, polygonal_cutout_radius_mm, polygonal_cutout_sides, align_vertex_theta_rad
+) -> trimesh.Trimesh:
+    """Build the shell for create_cylinder_shell; callers must copy the cached mesh before modifying it."""
     outer_radius = diameter_mm / 2
 
     # If no cutout is specified, return a solid cylinder mesh
@@ -187,7 +269,7 @@ def create_cylinder_shell(
     # Build 2D cross-section using Shapely: circle minus N-gon, then extrude once (serverless-friendly)
     try:
         # High-resolution circular boundary for smooth outer wall
-        outer_circle = ShapelyPoint(0.0, 0.0).buffer(outer_radius, resolution=128)
+        outer_circle = ShapelyPoint(0.0, 0.0).buffer(outer_radius, quad_segs=128)
 
         # Regular N-gon from inscribed radius
         polygonal_cutout_sides = max(3, int(polygonal_cutout_sides))
@@ -218,6 +300,102 @@ def create_cylinder_shell(
         return trimesh.creation.cylinder(radius=outer_radius, height=height_mm, sections=96)
 
 
+@lru_cache(maxsize=32)
+def _local_marker_prism(kind: str, dot_spacing: float, extrude_height: float, z_shift: float) -> trimesh.Trimesh:
+    """
+    Extrude a triangle or line marker in its local frame (X=tangent, Y=vertical, Z=radial).
+
+    Markers only differ between rows by their cylinder transform, so the local prism
+    is built once per shape and cached; callers must copy it before transforming.
+    """
+    half_width = dot_spacing / 2.0
+
+    # Vertices positioned at braille dots relative to cell center
+    if kind == 'triangle_180':
+        # 180-degree rotation from center: negate both X and Y coordinates
+        # This is used for counter plates to properly align with embosser plate triangles
+        # Original vertices: (-half_width, -dot_spacing), (-half_width, +dot_spacing), (+half_width, 0)
+        # After 180° rotation: (+half_width, +dot_spacing), (+half_width, -dot_spacing), (-half_width, 0)
+        outline = [
+            (half_width, dot_spacing),  # Rotated Dot 3 (was bottom-left, now top-right)
+            (half_width, -dot_spacing),  # Rotated Dot 1 (was top-left, now bottom-right)
+            (-half_width, 0.0),  # Rotated Dot 5 (apex now on left)
+        ]
+    elif kind == 'triangle_left':
+        # Mirror along vertical axis so apex points left (negative tangent)
+        outline = [
+            (half_width, -dot_spacing),  # Dot 6 position (bottom right)
+            (half_width, dot_spacing),  # Dot 4 position (top right)
+            (-half_width, 0.0),  # Dot 2 position (middle left, apex)
+        ]
+    elif kind == 'triangle':
+        # Normal orientation: apex points right
+        outline = [
+            (-half_width, -dot_spacing),  # Dot 3 - bottom left
+            (-half_width, dot_spacing),  # Dot 1 - top left
+            (half_width, 0.0),  # Dot 5 - middle right (apex)
+        ]
+    else:
+        # Vertical line, one dot spacing wide and a cell tall, centered at origin
+        outline = [
+            (-half_width, -dot_spacing),  # Bottom left
+            (half_width, -dot_spacing),  # Bottom right
+            (half_width, dot_spacing),  # Top right
+            (-half_width, dot_spacing),  # Top left
+        ]
+
+    prism = trimesh.creation.extrude_polygon(ShapelyPolygon(outline), height=extrude_height)
+    if z_shift:
+        prism.apply_translation([0, 0, z_shift])
+    return prism
+
+
+@lru_cache(maxsize=64)
+def _local_character_prism(
+    char_upper: str, char_width: float, char_height: float, extrude_height: float, z_shift: float
+) -> trimesh.Trimesh | None:
+    """
+    Extrude a character outline in its local marker frame, or return None if unusable.
+
+    Cached per (character, size, depth); callers must copy it before transforming.
+    """
+    char_2d = _build_character_polygon_proxy(char_upper, char_width, char_height)
+    if char_2d is None:
+        return None
+
+    prism = trimesh.creation.extrude_polygon(char_2d, height=extrude_height)
+    # Ensure the mesh is valid
+    if not prism.is_volume:
+        prism.fix_normals()
+        if not prism.is_volume:
+            logger.warning('Character mesh is not a valid volume')
+            return None
+    if z_shift:
+        prism.apply_translation([0, 0, z_shift])
+    return prism
+
+
+def _marker_to_cylinder(prism_local, r_hat, t_hat, z_hat, radial_axis, center_pos):
+    """Copy a cached local prism and map it onto the cylinder frame at center_pos."""
+    # Columns: X axis (tangential), Y axis (vertical), Z axis (radial).
+    # The prism's local offset is baked into the cached mesh, so one rotation plus the
+    # translation places it. The vertices are mapped directly into a new mesh rather than
+    # copying the template and calling apply_transform, which also carries over and
+    # re-validates the cached normals on every marker.
+    R = np.array(
+        [
+            [t_hat[0], z_hat[0], radial_axis[0]],
+            [t_hat[1], z_hat[1], radial_axis[1]],
+            [t_hat[2], z_hat[2], radial_axis[2]],
+        ]
+    )
+    vertices = prism_local.vertices.view(np.ndarray) @ R.T + np.asarray(center_pos, dtype=float)
+    faces = prism_local.faces.view(np.ndarray)
+    # An inward radial axis mirrors the frame; flip the winding so normals stay outward
+    faces = faces[:, ::-1].copy() if np.linalg.det(R) < 0 else faces.copy()
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+
 def create_cylinder_triangle_marker(
     x_arc,
     y_local,
@@ -252,97 +430,36 @@ def create_cylinder_triangle_marker(
         point_left: If True, mirror triangle so apex points toward negative tangent (left in unrolled view)
         rotate_180: If True, rotate triangle 180 degrees from center (for counter plate alignment)
     """
-    r_hat, t_hat, z_hat, radius, circumference, theta = _compute_cylinder_frame(
-        x_arc, cylinder_diameter_mm, seam_offset_deg
-    )
+    r_hat, t_hat, z_hat, radius, circumference, theta = _column_frame(x_arc, cylinder_diameter_mm, seam_offset_deg)
 
-    # Triangle dimensions - positioned at braille dots 1, 3, 5
-    # Vertical extent: 2 * dot_spacing (from dot 3 at bottom to dot 1 at top)
-    # Horizontal extent: dot_spacing (from left column to right column)
-    half_width = settings.dot_spacing / 2.0
-
-    # Build 2D triangle in local tangent (X=t) and vertical (Y=z) plane
-    # Vertices positioned at braille dots 1, 3, 5 relative to cell center
-
-    if rotate_180:
-        # 180-degree rotation from center: negate both X and Y coordinates
-        # This is used for counter plates to properly align with embosser plate triangles
-        # Original vertices: (-half_width, -dot_spacing), (-half_width, +dot_spacing), (+half_width, 0)
-        # After 180° rotation: (+half_width, +dot_spacing), (+half_width, -dot_spacing), (-half_width, 0)
-        tri_2d = ShapelyPolygon(
-            [
-                (half_width, settings.dot_spacing),  # Rotated Dot 3 (was bottom-left, now top-right)
-                (half_width, -settings.dot_spacing),  # Rotated Dot 1 (was top-left, now bottom-right)
-                (-half_width, 0.0),  # Rotated Dot 5 (apex now on left)
-            ]
-        )
-    elif point_left:
-        # Mirror along vertical axis so apex points left (negative tangent)
-        tri_2d = ShapelyPolygon(
-            [
-                (half_width, -settings.dot_spacing),  # Dot 6 position (bottom right)
-                (half_width, settings.dot_spacing),  # Dot 4 position (top right)
-                (-half_width, 0.0),  # Dot 2 position (middle left, apex)
-            ]
-        )
-    else:
-        # Normal orientation: apex points right
-        tri_2d = ShapelyPolygon(
-            [
-                (-half_width, -settings.dot_spacing),  # Dot 3 - bottom left
-                (-half_width, settings.dot_spacing),  # Dot 1 - top left
-                (half_width, 0.0),  # Dot 5 - middle right (apex)
-            ]
-        )
+    kind = 'triangle_180' if rotate_180 else 'triangle_left' if point_left else 'triangle'
+    ds = round(settings.dot_spacing, 4)
 
     # For subtraction tool, we need to extend beyond the surface
     if for_subtraction:
-        # Extrude to create cutting tool that extends from outside to inside the cylinder
-        extrude_height = height_mm + 1.0  # Total extrusion depth
-        tri_prism_local = trimesh.creation.extrude_polygon(tri_2d, height=extrude_height)
-
-        # The prism is created with Z from 0 to extrude_height
-        # We need to center it so it extends from -0.5 to (height_mm + 0.5)
-        tri_prism_local.apply_translation([0, 0, -0.5])
-
-        # Build transform: map local coords to cylinder coords
-        T = np.eye(4)
-        T[:3, 0] = t_hat  # X axis (tangential)
-        T[:3, 1] = z_hat  # Y axis (vertical)
-        T[:3, 2] = r_hat  # Z axis (radial outward)
+        # Cutting tool extends from -0.5 to (height_mm + 0.5) around the surface
+        tri_prism_local = _local_marker_prism(kind, ds, round(height_mm + 1.0, 4), -0.5)
 
         # Position so the prism starts outside the cylinder and cuts inward
         # The prism's Z=0 should be at radius (cylinder surface)
-        center_pos = r_hat * radius + z_hat * y_local
-        T[:3, 3] = center_pos
-
-        # Apply the transform
-        tri_prism_local.apply_transform(T)
+        tri_prism = _marker_to_cylinder(tri_prism_local, r_hat, t_hat, z_hat, r_hat, r_hat * radius + z_hat * y_local)
 
         # Debug output - only print for first triangle to avoid spam
         if abs(y_local) < settings.line_spacing:  # First row
             logger.debug(f'Triangle at theta={np.degrees(theta):.1f}°, y_local={y_local:.1f}mm')
-            logger.debug(f'Triangle bounds after transform: {tri_prism_local.bounds}')
+            logger.debug(f'Triangle bounds after transform: {tri_prism.bounds}')
             logger.debug(f'Cylinder radius: {radius}mm')
     else:
         # For extruded triangle (outward from cylinder surface)
-        tri_prism_local = trimesh.creation.extrude_polygon(tri_2d, height=height_mm)
-
-        # Build transform for outward extrusion
-        T = np.eye(4)
-        T[:3, 0] = t_hat  # X axis (tangential)
-        T[:3, 1] = z_hat  # Y axis (vertical)
-        T[:3, 2] = r_hat  # Z axis (radial outward)
+        tri_prism_local = _local_marker_prism(kind, ds, round(height_mm, 4), 0.0)
 
         # Slightly embed the triangle into the cylinder so union attaches robustly
         embed = max(getattr(settings, 'epsilon', 0.001), 0.05)
         # Place the base of the prism just inside the surface (radius - embed), extruding outward
         center_pos = r_hat * (radius - embed) + z_hat * y_local
-        T[:3, 3] = center_pos
+        tri_prism = _marker_to_cylinder(tri_prism_local, r_hat, t_hat, z_hat, r_hat, center_pos)
 
-        tri_prism_local.apply_transform(T)
-
-    return tri_prism_local
+    return tri_prism
 
 
 def create_cylinder_line_end_marker(
@@ -366,73 +483,23 @@ def create_cylinder_line_end_marker(
         height_mm: Depth/height of the line marker (default 0.5mm)
         for_subtraction: If True, creates a tool for boolean subtraction to make recesses
     """
-    radius = cylinder_diameter_mm / 2.0
-    circumference = np.pi * cylinder_diameter_mm
-
-    # Angle around cylinder for planar x position
-    theta = np.radians(seam_offset_deg) - (x_arc / circumference) * 2.0 * np.pi
-
-    # Local orthonormal frame at theta
-    r_hat = np.array([np.cos(theta), np.sin(theta), 0.0])  # radial outward
-    t_hat = np.array([-np.sin(theta), np.cos(theta), 0.0])  # tangential
-    z_hat = np.array([0.0, 0.0, 1.0])  # cylinder axis
-
-    # Line dimensions - vertical line at end of row
-    2.0 * settings.dot_spacing  # Vertical extent (same as cell height)
-    line_width = settings.dot_spacing  # Horizontal extent in tangent direction
-
-    # Build 2D rectangle in local tangent (X=t) and vertical (Y=z) plane
-    # Rectangle centered at origin, extending in both directions
-
-    line_2d = ShapelyPolygon(
-        [
-            (-line_width / 2, -settings.dot_spacing),  # Bottom left
-            (line_width / 2, -settings.dot_spacing),  # Bottom right
-            (line_width / 2, settings.dot_spacing),  # Top right
-            (-line_width / 2, settings.dot_spacing),  # Top left
-        ]
-    )
+    # Local orthonormal frame at the marker's angle
+    r_hat, t_hat, z_hat, radius, _, _ = _column_frame(x_arc, cylinder_diameter_mm, seam_offset_deg)
+    ds = round(settings.dot_spacing, 4)
 
     # For subtraction tool, we need to extend beyond the surface
     if for_subtraction:
-        # Extrude to create cutting tool that extends from outside to inside the cylinder
-        extrude_height = height_mm + 1.0  # Total extrusion depth
-        line_prism_local = trimesh.creation.extrude_polygon(line_2d, height=extrude_height)
-
-        # The prism is created with Z from 0 to extrude_height
-        # We need to center it so it extends from -0.5 to (height_mm + 0.5)
-        line_prism_local.apply_translation([0, 0, -0.5])
-
-        # Build transform: map local coords to cylinder coords
-        T = np.eye(4)
-        T[:3, 0] = t_hat  # X axis (tangential)
-        T[:3, 1] = z_hat  # Y axis (vertical)
-        T[:3, 2] = r_hat  # Z axis (radial outward)
+        # Cutting tool extends from -0.5 to (height_mm + 0.5) around the surface
+        line_prism_local = _local_marker_prism('line', ds, round(height_mm + 1.0, 4), -0.5)
 
         # Position so the prism starts outside the cylinder and cuts inward
         # The prism's Z=0 should be at radius (cylinder surface)
-        center_pos = r_hat * radius + z_hat * y_local
-        T[:3, 3] = center_pos
-
-        # Apply the transform
-        line_prism_local.apply_transform(T)
-    else:
-        # For direct recessed line (not used currently)
-        line_prism_local = trimesh.creation.extrude_polygon(line_2d, height=height_mm)
-
-        # Build transform for inward extrusion
-        T = np.eye(4)
-        T[:3, 0] = t_hat  # X axis
-        T[:3, 1] = z_hat  # Y axis
-        T[:3, 2] = -r_hat  # Z axis (inward)
+        return _marker_to_cylinder(line_prism_local, r_hat, t_hat, z_hat, r_hat, r_hat * radius + z_hat * y_local)
 
-        # Position recessed into surface
-        center_pos = r_hat * (radius - height_mm / 2.0) + z_hat * y_local
-        T[:3, 3] = center_pos
-
-        line_prism_local.apply_transform(T)
-
-    return line_prism_local
+    # For direct recessed line (not used currently): extrude inward, recessed into surface
+    line_prism_local = _local_marker_prism('line', ds, round(height_mm, 4), 0.0)
+    center_pos = r_hat * (radius - height_mm / 2.0) + z_hat * y_local
+    return _marker_to_cylinder(line_prism_local, r_hat, t_hat, z_hat, -r_hat, center_pos)
 
 
 def create_cylinder_character_shape(
@@ -462,19 +529,6 @@ def create_cylinder_character_shape(
     Returns:
         Trimesh object representing the 3D character marker transformed to cylinder
     """
-    # Debug: cylinder character marker generation
-
-    radius = cylinder_diameter_mm / 2.0
-    circumference = np.pi * cylinder_diameter_mm
-
-    # Angle around cylinder for planar x position
-    theta = np.radians(seam_offset_deg) - (x_arc / circumference) * 2.0 * np.pi
-
-    # Local orthonormal frame at theta
-    r_hat = np.array([np.cos(theta), np.sin(theta), 0.0])  # radial outward
-    t_hat = np.array([-np.sin(theta), np.cos(theta), 0.0])  # tangential
-    z_hat = np.array([0.0, 0.0, 1.0])  # cylinder axis
-
     # Define character size based on braille cell dimensions (scaled 56.25% bigger than original)
     char_height = 2 * settings.dot_spacing + 4.375  # 9.375mm for default 2.5mm dot spacing
     char_width = settings.dot_spacing * 0.8 + 2.6875  # 4.6875mm for default 2.5mm dot spacing
@@ -487,109 +541,86 @@ def create_cylinder_character_shape(
             x_arc, y_local, settings, cylinder_diameter_mm, seam_offset_deg, height_mm, for_subtraction
         )
 
+    # Subtraction tools extend from -0.5 to (height_mm + 0.5) around the surface
+    extrude_height = height_mm + 1.0 if for_subtraction else height_mm
+    z_shift = -0.5 if for_subtraction else 0.0
     try:
-        # Build character polygon using shared helper
-        char_2d = _build_character_polygon_proxy(char_upper, char_width, char_height)
-        if char_2d is None:
-            return create_cylinder_line_end_marker(
-                x_arc, y_local, settings, cylinder_diameter_mm, seam_offset_deg, height_mm, for_subtraction
-            )
-
+        char_prism_local = _local_character_prism(
+            char_upper, round(char_width, 3), round(char_height, 3), round(extrude_height, 4), z_shift
+        )
     except Exception as e:
-        logger.warning(f'Failed to create character shape using matplotlib: {e}')
+        logger.warning(f'Failed to create character shape: {e}')
+        char_prism_local = None
+
+    if char_prism_local is None:
         logger.info('Falling back to rectangle marker')
         return create_cylinder_line_end_marker(
             x_arc, y_local, settings, cylinder_diameter_mm, seam_offset_deg, height_mm, for_subtraction
         )
 
-    # For subtraction tool, we need to extend beyond the surface
-    try:
-        if for_subtraction:
-            # Extrude to create cutting tool that extends from outside to inside the cylinder
-            extrude_height = height_mm + 1.0  # Total extrusion depth
-            char_prism_local = trimesh.creation.extrude_polygon(char_2d, height=extrude_height)
-
-            # Ensure the mesh is valid
-            if not char_prism_local.is_volume:
-                char_prism_local.fix_normals()
-                if not char_prism_local.is_volume:
-                    logger.warning('Character mesh is not a valid volume')
-                    return create_cylinder_line_end_marker(
-                        x_arc, y_local, settings, cylinder_diameter_mm, seam_offset_deg, height_mm, for_subtraction
-                    )
-
-            # The prism is created with Z from 0 to extrude_height
-            # We need to center it so it extends from -0.5 to (height_mm + 0.5)
-            char_prism_local.apply_translation([0, 0, -0.5])
+    # Local orthonormal frame at the marker's angle
+    r_hat, t_hat, z_hat, radius, _, _ = _column_frame(x_arc, cylinder_diameter_mm, seam_offset_deg)
 
-            # Build transform: map local coords to cylinder coords
-            T = np.eye(4)
-            T[:3, 0] = t_hat  # X axis (tangential)
-            T[:3, 1] = z_hat  # Y axis (vertical)
-            T[:3, 2] = r_hat  # Z axis (radial outward)
+    if for_subtraction:
+        # Position so the prism starts outside the cylinder and cuts inward
+        # The prism's Z=0 should be at radius (cylinder surface)
+        return _marker_to_cylinder(char_prism_local, r_hat, t_hat, z_hat, r_hat, r_hat * radius + z_hat * y_local)
 
-            # Position so the prism starts outside the cylinder and cuts inward
-            # The prism's Z=0 should be at radius (cylinder surface)
-            center_pos = r_hat * radius + z_hat * y_local
-            T[:3, 3] = center_pos
+    # For direct recessed character (not used currently): extrude inward, recessed into surface
+    center_pos = r_hat * (radius - height_mm / 2.0) + z_hat * y_local
+    return _marker_to_cylinder(char_prism_local, r_hat, t_hat, z_hat, -r_hat, center_pos)
 
-            # Apply the transform
-            char_prism_local.apply_transform(T)
-        else:
-            # For direct recessed character (not used currently)
-            char_prism_local = trimesh.creation.extrude_polygon(char_2d, height=height_mm)
 
-            # Build transform for inward extrusion
-            T = np.eye(4)
-            T[:3, 0] = t_hat  # X axis
-            T[:3, 1] = z_hat  # Y axis
-            T[:3, 2] = -r_hat  # Z axis (inward)
+def _cylinder_dots_mesh(dot_template, r_hats, z_local, radius, settings: CardSettings) -> trimesh.Trimesh:
+    """
+    Orient copies of a dot built at the origin (axis along +Z) radially outward and place
+    each base flush with the cylinder outer surface, all in one mesh.
 
-            # Position recessed into surface
-            center_pos = r_hat * (radius - height_mm / 2.0) + z_hat * y_local
-            T[:3, 3] = center_pos
+    The template is not modified: every dot's vertices come from a single einsum over the
+    stacked per-dot rotations, and the faces are tiled with per-dot index offsets.
 
-            char_prism_local.apply_transform(T)
-    except Exception as e:
-        logger.warning(f'Failed to extrude character shape: {e}')
-        return create_cylinder_line_end_marker(
-            x_arc, y_local, settings, cylinder_diameter_mm, seam_offset_deg, height_mm, for_subtraction
-        )
+    Args:
+        dot_template: Origin-centered dot mesh (see braille_dot_template)
+        r_hats: (N, 3) radial unit vectors of the dots
+        z_local: (N,) heights of the dots relative to the cylinder center
+        radius: Cylinder outer radius
+        settings: CardSettings object with dot parameters
+    """
+    r_hats = np.asarray(r_hats, dtype=float).reshape(-1, 3)
+    cos_t = r_hats[:, 0]
+    sin_t = r_hats[:, 1]
+    # Quarter turn about the tangent (-sin, cos, 0), which takes the dot's +Z axis onto the radial
+    # direction r_hat = (cos, sin, 0). Rodrigues' formula for a 90 degree turn reduces to K + t t^T.
+    rotations = np.empty((len(r_hats), 3, 3))
+    rotations[:, 0, 0] = sin_t * sin_t
+    rotations[:, 0, 1] = -sin_t * cos_t
+    rotations[:, 0, 2] = cos_t
+    rotations[:, 1, 0] = -sin_t * cos_t
+    rotations[:, 1, 1] = cos_t * cos_t
+    rotations[:, 1, 2] = sin_t
+    rotations[:, 2, 0] = -cos_t
+    rotations[:, 2, 1] = -sin_t
+    rotations[:, 2, 2] = 0.0
+    # Use active height (cone or rounded)
+    center_radial_distance = radius + (settings.active_dot_height / 2.0)
+    centers = np.column_stack([cos_t * center_radial_distance, sin_t * center_radial_distance, z_local])
 
-    # Debug: cylinder character marker generated
-    return char_prism_local
+    tv = dot_template.vertices.view(np.ndarray)
+    tf = dot_template.faces.view(np.ndarray)
+    vertices = (np.einsum('nij,vj->nvi', rotations, tv) + centers[:, None, :]).reshape(-1, 3)
+    faces = (tf[None, :, :] + (np.arange(len(r_hats)) * len(tv))[:, None, None]).reshape(-1, 3)
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
 
 
 def create_cylinder_braille_dot(x, y, z, settings: CardSettings, cylinder_diameter_mm, seam_offset_deg=0):
     """
     Create a braille dot transformed to cylinder surface.
     """
-    # Create the dot at origin (axis along +Z)
-    dot = create_braille_dot(0, 0, 0, settings)
-
-    # Cylinder geometry
-    radius = cylinder_diameter_mm / 2.0
-    circumference = np.pi * cylinder_diameter_mm
-
-    # Angle around cylinder for planar x-position
-    theta = np.radians(seam_offset_deg) - (x / circumference) * 2.0 * np.pi
+    # Radial unit vector at the angle for this planar x-position
+    r_hat, _, _, radius, _, _ = _compute_cylinder_frame(x, cylinder_diameter_mm, seam_offset_deg)
 
-    # Unit vectors at this theta
-    r_hat = np.array([np.cos(theta), np.sin(theta), 0.0])
-    t_axis = np.array([-np.sin(theta), np.cos(theta), 0.0])  # tangent axis used for rotation
-
-    # Rotate dot so its +Z axis aligns with radial outward direction (r_hat)
-    rot_to_radial = trimesh.transformations.rotation_matrix(np.pi / 2.0, t_axis)
-    dot.apply_transform(rot_to_radial)
-
-    # Place the dot so its base is flush with the cylinder outer surface
-    # Use active height (cone or rounded)
-    dot_height = settings.active_dot_height
-    center_radial_distance = radius + (dot_height / 2.0)
-    center_position = r_hat * center_radial_distance + np.array([0.0, 0.0, y])
-    dot.apply_translation(center_position)
-
-    return dot
+    # Place the shared dot template (built at the origin, axis along +Z)
+    return _cylinder_dots_mesh(braille_dot_template(settings), r_hat, [y], radius, settings)
 
 
 def generate_cylinder_stl(lines, grade='g1', settings=None, cylinder_params=None, original_lines=None):
@@ -665,43 +696,20 @@ def generate_cylinder_stl(lines, grade='g1', settings=None, cylinder_params=None
     # Layout braille cells on cylinder
     cells, cells_per_row = layout_cylindrical_cells(lines, settings, diameter, height)
 
-    # Calculate vertical centering for markers
-    # The braille content spans from the top dot of the first row to the bottom dot of the last row
-    # Each cell has dots at offsets [+dot_spacing, 0, -dot_spacing] from cell center
-    # So a cell spans 2 * dot_spacing vertically
-
-    # Total content height calculation:
-    # - Distance between first and last row centers: (grid_rows - 1) * line_spacing
-    # - Half cell height above first row center: dot_spacing
-    # - Half cell height below last row center: dot_spacing
-    braille_content_height = (settings.grid_rows - 1) * settings.line_spacing + 2 * settings.dot_spacing
+    # Vertically centered row positions, mapped to the cylinder's local Z (centered at 0)
+    row_z_locals = (_row_center_ys(settings, height) - (height / 2.0)).tolist()
 
-    # Calculate where to position the first row's center
-    # We want the content centered, so:
-    # - Space above content = space below content = (cylinder_height - content_height) / 2
-    # - First row center = cylinder_height - space_above - dot_spacing
-    space_above = (height - braille_content_height) / 2.0
-    first_row_center_y = height - space_above - settings.dot_spacing
+    # Marker columns are the same on every row. The grid is centered, so start angle is -grid_angle/2
+    triangle_x = start_angle * radius
+    text_number_x = (start_angle + settings.cell_spacing / radius) * radius
 
     # Add end-of-row text/number indicators and triangle recess markers for ALL rows (not just those with content)
     text_number_meshes = []
     triangle_meshes = []
-    for row_num in range(settings.grid_rows):
-        # Calculate Y position for this row with vertical centering
-        y_pos = first_row_center_y - (row_num * settings.line_spacing) + settings.braille_y_adjust
-
-        # The grid is centered, so start angle is -grid_angle/2
-        grid_width = (settings.grid_columns - 1) * settings.cell_spacing
-        grid_angle = grid_width / radius
-        start_angle = -grid_angle / 2
-
-        # Y position in local cylinder coordinates
-        y_local = y_pos - (height / 2.0)
-
+    for row_num, y_local in enumerate(row_z_locals):
         # Cell #1 (column 0): Triangle alignment indicator - apex pointing right.
         # Always created; the triangles are critical to the mechanical device the
         # cylinder mounts into and have no user-facing toggle.
-        triangle_x = start_angle * radius
         triangle_mesh = create_cylinder_triangle_marker(
             triangle_x, y_local, settings, diameter, 0, height_mm=0.6, for_subtraction=True
         )
@@ -709,10 +717,6 @@ def generate_cylinder_stl(lines, grade='g1', settings=None, cylinder_params=None
 
         if getattr(settings, 'indicator_shapes', 1):
             # Cell #2 (column 1): Letter/number indicator (gated by the Indicator Letters toggle)
-            cell_spacing_angle = settings.cell_spacing / radius
-            text_number_angle = start_angle + cell_spacing_angle
-            text_number_x = text_number_angle * radius
-
             # Determine which character to use for the indicator
             if original_lines and row_num < len(original_lines):
                 original_text = original_lines[row_num].strip()
@@ -762,12 +766,9 @@ def generate_cylinder_stl(lines, grade='g1', settings=None, cylinder_params=None
     markers_applied = False
     if all_markers and _booleans_available():
         try:
-            # Union all markers first
-            union_markers = mesh_union(all_markers)
-
-            logger.debug('Marker union successful, subtracting from cylinder shell...')
-            # Subtract from shell to recess (serverless-compatible)
-            cylinder_shell = mesh_difference([cylinder_shell, union_markers])
+            # Subtract all markers in one boolean call; the manifold engine unions the
+            # cutters and subtracts them in a single evaluation without a mesh round trip
+            cylinder_shell = mesh_difference([cylinder_shell] + all_markers)
             logger.debug('Marker subtraction successful')
             markers_applied = True
         except Exception as e:
@@ -809,36 +810,32 @@ def generate_cylinder_stl(lines, grade='g1', settings=None, cylinder_params=None
     if grid_angle_deg > 360:
         logger.warning(f'Warning: Grid width ({grid_angle_deg:.1f}°) exceeds cylinder circumference (360°)')
 
-    # Convert dot spacing to angular measurements for cylinder
     radius = diameter / 2
-    dot_spacing_angle = settings.dot_spacing / radius  # Convert linear to angular
-
-    # Dot positioning with angular offsets for columns, linear for rows
-    dot_col_angle_offsets = [-dot_spacing_angle / 2, dot_spacing_angle / 2]
-    dot_row_offsets = [settings.dot_spacing, 0, -settings.dot_spacing]  # Vertical stays linear
-    dot_positions = [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]
-
-    # Create dots for each cell
-    for braille_char, cell_x, cell_y in cells:
-        dots = braille_to_dots(braille_char)
-
-        for i, dot_val in enumerate(dots):
-            if dot_val == 1:
-                dot_pos = dot_positions[i]
-                # Use angular offset for horizontal spacing, converted back to arc length
-                dot_x = cell_x + (dot_col_angle_offsets[dot_pos[1]] * radius)
-                dot_y = cell_y + dot_row_offsets[dot_pos[0]]
-                # Map absolute card Y to cylinder's local Z (centered at 0)
-                dot_z_local = dot_y - (height / 2.0)
-                z = polygonal_cutout_radius + settings.active_dot_height / 2  # unused in transform now
-
-                dot_mesh = create_cylinder_braille_dot(dot_x, dot_z_local, z, settings, diameter, 0)
-                meshes.append(dot_mesh)
-
-    logger.info(f'Created cylinder with {len(meshes) - 1} braille dots')
-
-    # Combine all meshes
-    final_mesh = trimesh.util.concatenate(meshes)
+    dot_offsets = _cylinder_dot_offsets(settings, radius)
+
+    # Decode every cell at once, then place all active dots with batched frames
+    dot_masks = braille_dot_mask(''.join(braille_char for braille_char, _, _ in cells))
+    cell_x = np.array([cell[1] for cell in cells], dtype=float)
+    cell_y = np.array([cell[2] for cell in cells], dtype=float)
+    dot_x_arc = (cell_x[:, None] + dot_offsets[:, 0])[dot_masks]
+    # Map absolute card Y to cylinder's local Z (centered at 0)
+    dot_z_local = (cell_y[:, None] + dot_offsets[:, 1] - (height / 2.0))[dot_masks]
+
+    if len(dot_x_arc):
+        r_hats, _, _, _, _, _ = _compute_cylinder_frames(dot_x_arc, diameter)
+        # Resolve the dot shape for these settings once; every dot is placed from the shared template
+        meshes.append(_cylinder_dots_mesh(braille_dot_template(settings), r_hats, dot_z_local, radius, settings))
+
+    logger.info(f'Created cylinder with {len(dot_x_arc)} braille dots')
+
+    # Combine all meshes: stack the vertex and face buffers directly (faces offset by the
+    # vertex counts before them) rather than going through trimesh.util.concatenate
+    vertex_offsets = np.cumsum([0] + [len(m.vertices) for m in meshes[:-1]])
+    final_mesh = trimesh.Trimesh(
+        vertices=np.vstack([m.vertices.view(np.ndarray) for m in meshes]),
+        faces=np.vstack([m.faces.view(np.ndarray) + offset for m, offset in zip(meshes, vertex_offsets, strict=True)]),
+        process=False,
+    )
 
     # The cylinder is already created with vertical axis (along Z)
     # No rotation needed - it should stand upright
@@ -916,31 +913,11 @@ def generate_cylinder_counter_plate(lines, settings: CardSettings, cylinder_para
 
     # Use grid_rows from settings
 
-    # Convert dot spacing to angular measurements
-    dot_spacing_angle = settings.dot_spacing / radius
-
     # Dot positioning with angular offsets for columns, linear for rows
-    dot_col_angle_offsets = [-dot_spacing_angle / 2, dot_spacing_angle / 2]
-    dot_row_offsets = [settings.dot_spacing, 0, -settings.dot_spacing]  # Vertical stays linear
-    dot_positions = [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]
+    dot_offsets = _cylinder_dot_offsets(settings, radius)
 
-    # Calculate vertical centering
-    # The braille content spans from the top dot of the first row to the bottom dot of the last row
-    # Each cell has dots at offsets [+dot_spacing, 0, -dot_spacing] from cell center
-    # So a cell spans 2 * dot_spacing vertically
-
-    # Total content height calculation:
-    # - Distance between first and last row centers: (grid_rows - 1) * line_spacing
-    # - Half cell height above first row center: dot_spacing
-    # - Half cell height below last row center: dot_spacing
-    braille_content_height = (settings.grid_rows - 1) * settings.line_spacing + 2 * settings.dot_spacing
-
-    # Calculate where to position the first row's center
-    # We want the content centered, so:
-    # - Space above content = space below content = (cylinder_height - content_height) / 2
-    # - First row center = cylinder_height - space_above - dot_spacing
-    space_above = (height - braille_content_height) / 2.0
-    first_row_center_y = height - space_above - settings.dot_spacing
+    # Vertically centered row positions (card Y), shared by the row markers and the dot recesses
+    row_ys = _row_center_ys(settings, height).tolist()
 
     # Create row markers (triangle and line) for ALL rows
     line_end_meshes = []
@@ -948,9 +925,9 @@ def generate_cylinder_counter_plate(lines, settings: CardSettings, cylinder_para
 
     # Create line ends and triangles for ALL rows in the grid to match embossing plate layout
     # For proper mirroring: Triangle at rightmost (last column), Rectangle at second-to-last column
-    for row_num in range(settings.grid_rows):
-        # Calculate Y position for this row with vertical centering
-        y_pos = first_row_center_y - (row_num * settings.line_spacing) + settings.braille_y_adjust
+    triangle_x = (start_angle + ((settings.grid_columns - 1) * cell_spacing_angle)) * radius
+    line_end_x = (start_angle + ((settings.grid_columns - 2) * cell_spacing_angle)) * radius
+    for y_pos in row_ys:
         y_local = y_pos - (height / 2.0)
 
         # For counter plate (mirrored from embossing plate):
@@ -962,8 +939,6 @@ def generate_cylinder_counter_plate(lines, settings: CardSettings, cylinder_para
 
         # Last column (triangle with 180-degree rotation for counter plate alignment).
         # Always created; the alignment triangles have no user-facing toggle.
-        triangle_col_angle = start_angle + ((settings.grid_columns - 1) * cell_spacing_angle)
-        triangle_x = triangle_col_angle * radius
         triangle_mesh = create_cylinder_triangle_marker(
             triangle_x,
             y_local,
@@ -977,18 +952,14 @@ def generate_cylinder_counter_plate(lines, settings: CardSettings, cylinder_para
         triangle_meshes.append(triangle_mesh)
 
         if getattr(settings, 'indicator_shapes', 1):
-            # Second-to-last column (square placeholder mirroring the indicator letter):
-            rect_col_angle = start_angle + ((settings.grid_columns - 2) * cell_spacing_angle)
-            line_end_x = rect_col_angle * radius
+            # Second-to-last column (square placeholder mirroring the indicator letter)
             line_end_mesh = create_cylinder_line_end_marker(
                 line_end_x, y_local, settings, diameter, 0, height_mm=0.5, for_subtraction=True
             )
             line_end_meshes.append(line_end_mesh)
 
     # Create recess tools for ALL dot positions in ALL cells (universal counter plate)
-    sphere_meshes = []
-
-    # Get recess shape once outside the loop
+    # Get recess shape once
     recess_shape = int(getattr(settings, 'recess_shape', 1))
 
     # Process ALL cells in the grid (not just those with braille content)
@@ -1002,148 +973,69 @@ def generate_cylinder_counter_plate(lines, settings: CardSettings, cylinder_para
         f'Counter plate grid: {settings.grid_columns} columns, {reserved} reserved for indicators, {num_text_cols} braille cells per row'
     )
 
-    for row_num in range(settings.grid_rows):
-        # Calculate Y position for this row with vertical centering
-        y_pos = first_row_center_y - (row_num * settings.line_spacing) + settings.braille_y_adjust
-
-        # Process ALL columns mirrored
-        # Braille cells are at columns 0 to (num_text_cols-1); markers occupy the rightmost positions
-        # Indicator letters ON: braille at cols 0 to grid_columns-3, square at grid_columns-2, triangle at grid_columns-1
-        # Indicator letters OFF: braille at cols 0 to grid_columns-2, triangle at grid_columns-1
-        for col_num in range(num_text_cols):
-            # Mirror column index across row so cells are placed right-to-left
-            # This creates the mirror effect where embossing plate's first braille cell aligns with counter plate's last braille cell
-            mirrored_idx = (num_text_cols - 1) - col_num
-            # Calculate cell position - braille cells start from column 0 (leftmost)
-            cell_angle = start_angle + (mirrored_idx * cell_spacing_angle)
-            cell_x = cell_angle * radius  # Convert to arc length
-
-            # Create recess tool for ALL 6 dots in this cell
-            for dot_idx in range(6):
-                dot_pos = dot_positions[dot_idx]
-                # Use angular offset for horizontal spacing, converted back to arc length
-                dot_x = cell_x + (dot_col_angle_offsets[dot_pos[1]] * radius)
-                dot_y = y_pos + dot_row_offsets[dot_pos[0]]
-
-                if recess_shape == 2:
-                    # Cone frustum on cylinder surface oriented along radial direction
-                    base_d = float(
-                        getattr(
-                            settings,
-                            'cone_counter_dot_base_diameter',
-                            getattr(settings, 'counter_dot_base_diameter', 1.6),
-                        )
-                    )
-                    hat_d = float(getattr(settings, 'cone_counter_dot_flat_hat', 0.4))
-                    h_cone = float(getattr(settings, 'cone_counter_dot_height', 0.8))
-                    base_r = max(settings.epsilon_mm, base_d / 2.0)
-                    hat_r = max(settings.epsilon_mm, hat_d / 2.0)
-                    # Ensure recess height exceeds radial overcut so it properly intersects the outer surface
-                    radial_overcut = max(
-                        settings.epsilon_mm, getattr(settings, 'cylinder_counter_plate_overcut_mm', 0.05)
-                    )
-                    h_cone = max(settings.epsilon_mm, h_cone + radial_overcut)
-                    segments = 24
-                    # Build local frustum along +Z with base at z=0 and bottom at z=-h_cone
-                    angles = np.linspace(0, 2 * np.pi, segments, endpoint=False)
-                    top_ring = np.column_stack(
-                        [base_r * np.cos(angles), base_r * np.sin(angles), np.zeros_like(angles)]
-                    )
-                    bot_ring = np.column_stack(
-                        [hat_r * np.cos(angles), hat_r * np.sin(angles), -h_cone * np.ones_like(angles)]
-                    )
-                    vertices = np.vstack([top_ring, bot_ring, [[0, 0, 0]], [[0, 0, -h_cone]]])
-                    top_center_index = 2 * segments
-                    bot_center_index = 2 * segments + 1
-                    faces = []
-                    for i in range(segments):
-                        j = (i + 1) % segments
-                        # indices
-                        ti = i
-                        tj = j
-                        bi = segments + i
-                        bj = segments + j
-                        # side quad as two triangles (ensure correct orientation for outward normals)
-                        faces.append([ti, bi, tj])
-                        faces.append([bi, bj, tj])
-                        # top cap - outward normal pointing up
-                        faces.append([top_center_index, ti, tj])
-                        # bottom cap - outward normal pointing down
-                        faces.append([bot_center_index, bj, bi])
-                    frustum = trimesh.Trimesh(vertices=vertices, faces=np.array(faces), process=True)
-                    if not frustum.is_volume:
-                        try:
-                            frustum.fix_normals()
-                            # Ensure the mesh is watertight and has proper orientation
-                            if not frustum.is_watertight:
-                                frustum.fill_holes()
-                            # Force recomputation of volume properties
-                            frustum._cache.clear()
-                            if not frustum.is_volume:
-                                # If still not a volume, try to repair it
-                                frustum = frustum.repair()
-                        except Exception:
-                            pass
-                    # Transform to cylinder surface with local frame
-                    # Braille content uses fixed position (seam_offset only affects polygon cutout)
-                    outer_radius = diameter / 2
-                    theta = -(dot_x / (np.pi * diameter)) * 2 * np.pi
-                    r_hat = np.array([np.cos(theta), np.sin(theta), 0.0])
-                    t_hat = np.array([-np.sin(theta), np.cos(theta), 0.0])
-                    z_hat = np.array([0.0, 0.0, 1.0])
-                    # Base center on cylinder surface
-                    overcut = max(settings.epsilon, getattr(settings, 'cylinder_counter_plate_overcut_mm', 0.05))
-                    base_center = r_hat * (outer_radius + overcut) + z_hat * (dot_y - (height / 2.0))
-                    T = np.eye(4)
-                    T[:3, 0] = t_hat
-                    T[:3, 1] = z_hat
-                    T[:3, 2] = r_hat
-                    T[:3, 3] = base_center
-                    frustum.apply_transform(T)
-                    sphere_meshes.append(frustum)
-                else:
-                    # Create sphere for hemisphere or bowl cap
-                    # Choose base diameter based on selected recess shape
-                    use_bowl = recess_shape == 1
-                    try:
-                        if use_bowl:
-                            counter_base = float(
-                                getattr(settings, 'bowl_counter_dot_base_diameter', settings.counter_dot_base_diameter)
-                            )
-                        else:
-                            counter_base = float(
-                                getattr(settings, 'hemi_counter_dot_base_diameter', settings.counter_dot_base_diameter)
-                            )
-                    except Exception:
-                        counter_base = settings.emboss_dot_base_diameter + settings.counter_plate_dot_size_offset
-                    a = counter_base / 2.0
-                    if use_bowl:
-                        h = float(getattr(settings, 'counter_dot_depth', 0.6))
-                        # Guard minimum
-                        h = max(settings.epsilon_mm, h)
-                        sphere_radius = (a * a + h * h) / (2.0 * h)
-                    else:
-                        sphere_radius = a
-                    sphere = trimesh.creation.icosphere(
-                        subdivisions=settings.hemisphere_subdivisions, radius=sphere_radius
-                    )
-                    if not sphere.is_volume:
-                        sphere.fix_normals()
-                    outer_radius = diameter / 2
-                    # Braille content uses fixed position (seam_offset only affects polygon cutout)
-                    theta = -(dot_x / (np.pi * diameter)) * 2 * np.pi
-                    overcut = max(settings.epsilon, getattr(settings, 'cylinder_counter_plate_overcut_mm', 0.05))
-                    if use_bowl:
-                        h = float(getattr(settings, 'counter_dot_depth', 0.6))
-                        h = max(settings.epsilon_mm, h)
-                        center_radius = outer_radius + (sphere_radius - h)
-                    else:
-                        center_radius = outer_radius + overcut
-                    cyl_x = center_radius * np.cos(theta)
-                    cyl_y = center_radius * np.sin(theta)
-                    cyl_z = dot_y - (height / 2.0)
-                    sphere.apply_translation([cyl_x, cyl_y, cyl_z])
-                    sphere_meshes.append(sphere)
+    # Braille cells are at columns 0 to (num_text_cols-1); markers occupy the rightmost positions
+    # Indicator letters ON: braille at cols 0 to grid_columns-3, square at grid_columns-2, triangle at grid_columns-1
+    # Indicator letters OFF: braille at cols 0 to grid_columns-2, triangle at grid_columns-1
+    # Mirror column index across row so cells are placed right-to-left. This creates the mirror
+    # effect where embossing plate's first braille cell aligns with counter plate's last braille cell
+    mirrored_idx = np.arange(max(num_text_cols, 0))[::-1]
+    cell_x = (start_angle + (mirrored_idx * cell_spacing_angle)) * radius  # Convert to arc length
+
+    # Every dot of every cell, ordered by row, then column, then dot number
+    grid_shape = (len(row_ys), len(cell_x), 6)
+    dot_x = np.broadcast_to(cell_x[None, :, None] + dot_offsets[:, 0], grid_shape).ravel()
+    # Map absolute card Y to cylinder's local Z (centered at 0)
+    dot_y = np.array(row_ys)[:, None, None] + dot_offsets[:, 1]
+    dot_z_local = np.broadcast_to(dot_y - (height / 2.0), grid_shape).ravel()
+    # Braille content uses fixed position (seam_offset only affects polygon cutout)
+    r_hats, t_hats, z_hat, outer_radius, _, _ = _compute_cylinder_frames(dot_x, diameter)
+
+    if recess_shape == 2:
+        # Cone frustum on cylinder surface oriented along radial direction.
+        # Every cone recess is the same frustum, so build it once and only transform copies per dot
+        base_d = float(settings.cone_counter_dot_base_diameter)
+        hat_d = float(getattr(settings, 'cone_counter_dot_flat_hat', 0.4))
+        h_cone = float(getattr(settings, 'cone_counter_dot_height', 0.8))
+        base_r = max(settings.epsilon_mm, base_d / 2.0)
+        hat_r = max(settings.epsilon_mm, hat_d / 2.0)
+        # Ensure recess height exceeds radial overcut so it properly intersects the outer surface
+        radial_overcut = max(settings.epsilon_mm, getattr(settings, 'cylinder_counter_plate_overcut_mm', 0.05))
+        h_cone = max(settings.epsilon_mm, h_cone + radial_overcut)
+        cone_overcut = max(settings.epsilon, getattr(settings, 'cylinder_counter_plate_overcut_mm', 0.05))
+
+        # Local frame columns: X tangential, Y vertical, Z radial (same as _marker_to_cylinder)
+        rotations = np.empty((len(dot_x), 3, 3))
+        rotations[:, :, 0] = t_hats
+        rotations[:, :, 1] = z_hat
+        rotations[:, :, 2] = r_hats
+        # Base center on cylinder surface
+        centers = r_hats * (outer_radius + cone_overcut) + z_hat * dot_z_local[:, None]
+        sphere_meshes = instance_meshes(cone_recess_template(base_r, hat_r, h_cone, 24), centers, rotations)
+    else:
+        # Create sphere for hemisphere or bowl cap
+        # Choose base diameter based on selected recess shape
+        use_bowl = recess_shape == 1
+        if use_bowl:
+            counter_base = float(settings.bowl_counter_dot_base_diameter)
+        else:
+            counter_base = float(settings.hemi_counter_dot_base_diameter)
+        a = counter_base / 2.0
+        overcut = max(settings.epsilon, getattr(settings, 'cylinder_counter_plate_overcut_mm', 0.05))
+        if use_bowl:
+            h = float(getattr(settings, 'counter_dot_depth', 0.6))
+            # Guard minimum
+            h = max(settings.epsilon_mm, h)
+            sphere_radius = (a * a + h * h) / (2.0 * h)
+            center_radius = outer_radius + (sphere_radius - h)
+        else:
+            sphere_radius = a
+            center_radius = outer_radius + overcut
+        # Every recess is the same sphere, so build it once and only translate copies per dot
+        sphere = trimesh.creation.icosphere(subdivisions=settings.hemisphere_subdivisions, radius=sphere_radius)
+        if not sphere.is_volume:
+            sphere.fix_normals()
+        centers = np.column_stack([center_radius * r_hats[:, 0], center_radius * r_hats[:, 1], dot_z_local])
+        sphere_meshes = instance_meshes(sphere, centers)
 
     logger.debug(f'Creating {len(sphere_meshes)} recess tools on cylinder counter plate (recess_shape={recess_shape})')
 
@@ -1157,71 +1049,18 @@ def generate_cylinder_counter_plate(lines, settings: CardSettings, cylinder_para
 
         return cylinder_shell
 
-    # Special-case: for cone frusta, prefer individual subtraction for robustness
-    if recess_shape == 2 and sphere_meshes:
-        try:
-            logger.debug('Cylinder cone mode - subtracting frusta individually for robustness...')
-            result_shell = cylinder_shell.copy()
-            for i, tool in enumerate(sphere_meshes):
-                try:
-                    logger.debug(f'Cylinder subtract recess tool {i + 1}/{len(sphere_meshes)}')
-                    result_shell = mesh_difference([result_shell, tool])
-                except Exception as e_tool:
-                    logger.warning(f'Cylinder cone subtraction failed for tool {i + 1}: {e_tool}')
-                    continue
-            for i, triangle in enumerate(triangle_meshes):
-                try:
-                    result_shell = mesh_difference([result_shell, triangle])
-                except Exception as e_tri:
-                    logger.warning(f'Cylinder triangle subtraction failed {i + 1}: {e_tri}')
-                    continue
-            for i, line_end in enumerate(line_end_meshes):
-                try:
-                    result_shell = mesh_difference([result_shell, line_end])
-                except Exception as e_line:
-                    logger.warning(f'Cylinder line-end subtraction failed {i + 1}: {e_line}')
-                    continue
-            if not result_shell.is_watertight:
-                result_shell.fill_holes()
-            min_z = result_shell.bounds[0][2]
-            result_shell.apply_translation([0, 0, -min_z])
-            logger.debug(f'Cylinder cone plate completed: {len(result_shell.vertices)} vertices')
-            return result_shell
-        except Exception as e_cyl_cone:
-            logger.error(f'Cylinder cone individual subtraction failed: {e_cyl_cone}')
-            # Fall through to robust boolean strategy below as a last attempt
-
-    # More robust boolean strategy:
+    # More robust boolean strategy (for every recess shape, including cone frusta):
     # 1) Start with the cylinder shell (which already has the polygonal cutout)
-    # 2) Subtract the union of all spheres and triangles to create outer recesses
+    # 2) Subtract all recess tools, line ends and triangles to create outer recesses
+    # Subtracting tools one at a time is kept below only as a fallback
 
     try:
-        # Batch union to reduce complexity, then single subtract
-        logger.debug('Cylinder boolean - batch union spheres...')
-        union_spheres = batch_union(sphere_meshes, batch_size=64)
-
-        union_triangles = None
-        if triangle_meshes:
-            logger.debug('Cylinder boolean - batch union triangles...')
-            union_triangles = batch_union(triangle_meshes, batch_size=32)
-
-        union_line_ends = None
-        if line_end_meshes:
-            logger.debug('Cylinder boolean - batch union line ends...')
-            union_line_ends = batch_union(line_end_meshes, batch_size=32)
-
-        cutouts_list = [union_spheres]
-        if union_line_ends is not None:
-            cutouts_list.append(union_line_ends)
-        if union_triangles is not None:
-            cutouts_list.append(union_triangles)
-
-        all_cutouts = mesh_union(cutouts_list)
-
+        # One difference over every cutter: the manifold engine unions the cutters and subtracts
+        # them in a single evaluation, without round-tripping intermediate unions through trimesh
         logger.debug('Cylinder boolean - subtracting all cutouts from shell...')
-        final_shell = mesh_difference([cylinder_shell, all_cutouts])
+        final_shell = mesh_difference([cylinder_shell] + sphere_meshes + line_end_meshes + triangle_meshes)
 
-        if not final_shell.is_watertight:
+        if not is_manifold_result(final_shell) and not final_shell.is_watertight:
             logger.debug('Cylinder final shell not watertight, attempting to fill holes...')
             final_shell.fill_holes()
 
@@ -1235,16 +1074,17 @@ def generate_cylinder_counter_plate(lines, settings: CardSettings, cylinder_para
     except Exception as e:
         logger.error(f'Cylinder robust boolean failed: {e}')
 
-    # Fallback: subtract spheres individually from cylinder shell
+    # Fallback: union the recess tools pairwise, then subtract the resulting groups individually
     try:
         logger.debug('Fallback - individual subtraction from cylinder shell...')
         result_shell = cylinder_shell.copy()
-        for i, sphere in enumerate(sphere_meshes):
+        sphere_groups = pairwise_union(sphere_meshes)
+        for i, sphere in enumerate(sphere_groups):
             try:
-                logger.debug(f'Subtracting sphere {i + 1}/{len(sphere_meshes)} from cylinder shell...')
+                logger.debug(f'Subtracting sphere group {i + 1}/{len(sphere_groups)} from cylinder shell...')
                 result_shell = mesh_difference([result_shell, sphere])
             except Exception as sphere_error:
-                logger.warning(f'Failed to subtract sphere {i + 1}: {sphere_error}')
+                logger.warning(f'Failed to subtract sphere group {i + 1}: {sphere_error}')
                 continue
 
         # Subtract triangles individually (recess them)
@@ -1266,7 +1106,7 @@ def generate_cylinder_counter_plate(lines, settings: CardSettings, cylinder_para
                 continue
 
         final_shell = result_shell
-        if not final_shell.is_watertight:
+        if not is_manifold_result(final_shell) and not final_shell.is_watertight:
             final_shell.fill_holes()
         logger.debug(f'Fallback completed: {len(final_shell.vertices)} vertices, {len(final_shell.faces)} faces')
 
@@ -5,79 +5,207 @@ This module contains pure functions that build mesh primitives for different
 braille dot styles: cones, frustums, hemispheres, and bowls (spherical caps).
 """
 
+from functools import lru_cache
+
 import numpy as np
 import trimesh
 
 
-def create_braille_dot(x, y, z, settings):
+@lru_cache(maxsize=16)
+def _frustum_template(base_radius: float, top_radius: float, height: float, sections: int) -> trimesh.Trimesh:
     """
-    Create a braille dot mesh at the origin, then translate to (x, y, z).
+    Build a conical frustum centered at the origin as a surface of revolution.
+
+    Uses the same closed profile trimesh.creation.cylinder revolves, with the top
+    corner pulled in to the top radius, so no vertex search or rescaling is needed.
+
+    Cached because every dot on a plate shares the same dimensions; callers must
+    copy the returned mesh before modifying it.
+    """
+    half = height / 2.0
+    profile = np.array([[0.0, -half], [base_radius, -half], [top_radius, half], [0.0, half]])
+    return trimesh.creation.revolve(profile, sections=sections)
+
+
+@lru_cache(maxsize=16)
+def _rounded_dot_template(
+    base_radius: float, top_radius: float, base_h: float, dome_h: float, subdivisions: int
+) -> trimesh.Trimesh:
+    """
+    Build a rounded dot (frustum base + spherical cap dome) centered on the origin.
+
+    The dot is a single surface of revolution: the frustum side followed by the
+    spherical cap arc, whose base radius equals the frustum top radius. Building
+    the cap analytically avoids both a boolean intersection and the hidden,
+    overlapping lower half of a full sphere.
+
+    Cached by dimensions; callers must copy the returned mesh before modifying it.
+    """
+    z_bottom = -(base_h + dome_h) / 2.0
+    z_top = z_bottom + base_h  # frustum top / cap base
+
+    # Sphere through the cap rim and apex
+    R = (top_radius * top_radius + dome_h * dome_h) / (2.0 * dome_h)
+    zc = z_top + dome_h - R
+    # Polar angle of the cap rim (> pi/2 when the cap is taller than a hemisphere)
+    rim_angle = np.arctan2(top_radius, z_top - zc)
+    arc_steps = max(4, 2**subdivisions)
+    theta = np.linspace(rim_angle, 0.0, arc_steps + 1)
+    arc = np.column_stack([R * np.sin(theta), zc + R * np.cos(theta)])
+    arc[-1, 0] = 0.0  # apex exactly on the axis
+
+    profile = [(0.0, z_bottom)]
+    if base_h > 0:
+        profile.append((base_radius, z_bottom))
+    profile.extend(map(tuple, arc))
+    return trimesh.creation.revolve(np.asarray(profile), sections=48)
+
+
+@lru_cache(maxsize=4)
+def _frustum_face_table(segments: int) -> np.ndarray:
+    """
+    Face indices of a capped frustum whose vertices are [top ring, bottom ring, top center, bottom center].
+
+    Per segment: the side quad as two triangles, then the top cap (normal up) and the
+    bottom cap (normal down). Built with numpy once per segment count.
+    """
+    ti = np.arange(segments)
+    tj = (ti + 1) % segments
+    bi = segments + ti
+    bj = segments + tj
+    top_center = np.full(segments, 2 * segments)
+    bot_center = np.full(segments, 2 * segments + 1)
+    faces = np.stack(
+        [
+            np.column_stack([ti, bi, tj]),
+            np.column_stack([bi, bj, tj]),
+            np.column_stack([top_center, ti, tj]),
+            np.column_stack([bot_center, bj, bi]),
+        ],
+        axis=1,
+    ).reshape(-1, 3)
+    faces.flags.writeable = False
+    return faces
+
+
+@lru_cache(maxsize=8)
+def cone_recess_template(base_radius: float, hat_radius: float, depth: float, segments: int) -> trimesh.Trimesh:
+    """
+    Cone recess cutter: base ring of base_radius at z=0 narrowing to a flat hat of hat_radius at z=-depth.
+
+    Used by the cone counter plates. Cached per size; callers must copy the returned
+    mesh before modifying it.
+    """
+    angles = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    cos_a = np.cos(angles)
+    sin_a = np.sin(angles)
+    top_ring = np.column_stack([base_radius * cos_a, base_radius * sin_a, np.zeros_like(angles)])
+    bot_ring = np.column_stack([hat_radius * cos_a, hat_radius * sin_a, -depth * np.ones_like(angles)])
+    vertices = np.vstack([top_ring, bot_ring, [[0, 0, 0]], [[0, 0, -depth]]])
+
+    # Vertices are analytic and unique and the face table is closed and consistently wound
+    # (outward normals), so skip trimesh's merge/validation pass and any repair
+    return trimesh.Trimesh(vertices=vertices, faces=_frustum_face_table(segments).copy(), process=False)
+
+
+def braille_dot_template(settings) -> trimesh.Trimesh:
+    """
+    Return the shared origin-centered dot mesh for the given settings.
+
     - Default: cone frustum using emboss parameters
     - Optional: rounded dome (spherical cap) using rounded parameters
 
+    The returned mesh is cached and shared; copy it before modifying.
+
     Args:
-        x, y, z: Target position for the dot
         settings: CardSettings object with dot parameters
 
     Returns:
-        Trimesh object representing the braille dot
+        Trimesh object centered on the origin
     """
     if getattr(settings, 'use_rounded_dots', 0):
         # Cone frustum base + spherical cap dome (dome diameter equals cone flat-top diameter)
-        base_diameter = float(
-            getattr(settings, 'rounded_dot_base_diameter', getattr(settings, 'rounded_dot_diameter', 2.0))
-        )
-        dome_diameter = float(
-            getattr(settings, 'rounded_dot_dome_diameter', getattr(settings, 'rounded_dot_base_diameter', 1.5))
-        )
-        base_radius = max(0.0, base_diameter / 2.0)
-        top_radius = max(0.0, dome_diameter / 2.0)
-        base_h = float(
-            getattr(settings, 'rounded_dot_base_height', getattr(settings, 'rounded_dot_cylinder_height', 0.2))
-        )
-        dome_h = float(getattr(settings, 'rounded_dot_dome_height', getattr(settings, 'rounded_dot_height', 0.6)))
+        base_radius = max(0.0, float(settings.rounded_dot_base_diameter) / 2.0)
+        top_radius = max(0.0, float(settings.rounded_dot_dome_diameter) / 2.0)
+        base_h = float(settings.rounded_dot_base_height)
+        dome_h = float(settings.rounded_dot_dome_height)
         if base_radius > 0 and base_h >= 0 and dome_h > 0:
-            parts = []
-            # Build a conical frustum by scaling the top ring of a cylinder
-            if base_h > 0:
-                frustum = trimesh.creation.cylinder(radius=base_radius, height=base_h, sections=48)
-                # Scale top vertices in XY so top radius equals top_radius
-                if base_radius > 0:
-                    scale_factor = (top_radius / base_radius) if base_radius > 1e-9 else 1.0
-                else:
-                    scale_factor = 1.0
-                top_z = frustum.vertices[:, 2].max()
-                is_top = np.isclose(frustum.vertices[:, 2], top_z)
-                frustum.vertices[is_top, :2] *= scale_factor
-                parts.append(frustum)
-
-            # Spherical cap dome starting at top of frustum; base radius = top_radius
-            # Serverless-friendly: avoid boolean intersection; place sphere so lower portion overlaps cylinder base
-            # The overlap is acceptable for STL export and avoids external boolean backends.
-            R = (top_radius * top_radius + dome_h * dome_h) / (2.0 * dome_h)
-            zc = (base_h / 2.0) + (dome_h - R)  # center so cap base lies near z = base_h/2
-            sphere = trimesh.creation.icosphere(
-                radius=R, subdivisions=max(2, int(getattr(settings, 'hemisphere_subdivisions', 1)) + 2)
-            )
-            sphere.apply_translation([0.0, 0.0, zc])
-            parts.append(sphere)
-
-            # Combine, recenter by shifting down half of dome height, then translate to (x, y, z)
-            dot = trimesh.util.concatenate(parts)
-            dot.apply_translation([0.0, 0.0, -dome_h / 2.0])
-            dot.apply_translation((x, y, z))
-            return dot
+            subdivisions = max(2, int(getattr(settings, 'hemisphere_subdivisions', 1)) + 2)
+            return _rounded_dot_template(base_radius, top_radius, base_h, dome_h, subdivisions)
 
     # Default cone frustum path
-    cylinder = trimesh.creation.cylinder(
-        radius=settings.emboss_dot_base_diameter / 2, height=settings.emboss_dot_height, sections=16
-    )
-
-    if settings.emboss_dot_base_diameter > 0:
-        scale_factor = settings.emboss_dot_flat_hat / settings.emboss_dot_base_diameter
-        top_surface_z = cylinder.vertices[:, 2].max()
-        is_top_vertex = np.isclose(cylinder.vertices[:, 2], top_surface_z)
-        cylinder.vertices[is_top_vertex, :2] *= scale_factor
-
-    cylinder.apply_translation((x, y, z))
-    return cylinder
+    base_diameter = float(settings.emboss_dot_base_diameter)
+    top_radius = float(settings.emboss_dot_flat_hat) / 2 if base_diameter > 0 else base_diameter / 2
+    return _frustum_template(base_diameter / 2, top_radius, float(settings.emboss_dot_height), 16)
+
+
+def create_braille_dot(x, y, z, settings):
+    """
+    Create a braille dot mesh at the origin, then translate to (x, y, z).
+
+    The origin-centered shape is built once per distinct set of dimensions and
+    copied for each dot.
+
+    Args:
+        x, y, z: Target position for the dot
+        settings: CardSettings object with dot parameters
+
+    Returns:
+        Trimesh object representing the braille dot
+    """
+    dot = braille_dot_template(settings).copy()
+    dot.apply_translation((x, y, z))
+    return dot
+
+
+def build_all_dots(positions, settings) -> trimesh.Trimesh | None:
+    """
+    Build every dot of a plate as one mesh by instancing the shared template.
+
+    Vertices and faces are tiled with numpy instead of creating and
+    concatenating one Trimesh per dot.
+
+    Args:
+        positions: (N, 3) array-like of dot center positions
+        settings: CardSettings object with dot parameters
+
+    Returns:
+        Single Trimesh containing all dots, or None if there are no positions
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    if len(positions) == 0:
+        return None
+
+    template = braille_dot_template(settings)
+    tv = template.vertices.view(np.ndarray)
+    tf = template.faces.view(np.ndarray)
+    n_verts = len(tv)
+
+    vertices = (tv[None, :, :] + positions[:, None, :]).reshape(-1, 3)
+    faces = (tf[None, :, :] + (np.arange(len(positions)) * n_verts)[:, None, None]).reshape(-1, 3)
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+
+def instance_meshes(template, centers, rotations=None) -> list[trimesh.Trimesh]:
+    """
+    Place one copy of a template mesh at each center, optionally rotated first.
+
+    All vertices are transformed in one batched numpy operation; each copy is still
+    returned as its own mesh so callers can subtract cutters one at a time.
+
+    Args:
+        template: Mesh built at the origin; it is not modified
+        centers: (N, 3) array-like of translations
+        rotations: Optional (N, 3, 3) rotation matrices applied before translating
+
+    Returns:
+        List of N independent Trimesh objects
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    tv = template.vertices.view(np.ndarray)
+    if rotations is None:
+        vertices = tv[None, :, :] + centers[:, None, :]
+    else:
+        vertices = np.einsum('nij,vj->nvi', rotations, tv) + centers[:, None, :]
+    faces = template.faces.view(np.ndarray)
+    return [trimesh.Trimesh(vertices=v, faces=faces.copy(), process=False) for v in vertices]
@@ -6,25 +6,145 @@ plates for flat braille cards.
 """
 
 import numpy as np
+import shapely
 import trimesh
-from shapely.geometry import Point, Polygon
-from shapely.ops import unary_union
+from shapely.geometry import Polygon
 
-from app.geometry.booleans import mesh_difference, mesh_union
+from app.geometry.booleans import is_manifold_result, mesh_difference, mesh_union, pairwise_union
 from app.geometry.braille_layout import (
+    braille_dot_mask,
     create_card_line_end_marker_3d,
     create_card_triangle_marker_3d,
-    create_character_shape_3d,
     create_character_shape_polygon,
     create_line_marker_polygon,
     create_triangle_marker_polygon,
 )
-from app.geometry.dot_shapes import create_braille_dot
+from app.geometry.dot_shapes import build_all_dots, cone_recess_template, instance_meshes
 from app.models import CardSettings
-from app.utils import braille_to_dots, get_logger
+from app.utils import get_logger, has_braille_chars
 
 logger = get_logger(__name__)
 
+# Segments per quarter circle for 2D counter plate holes. 1-2 mm holes gain nothing
+# printable beyond this, while every extra segment costs in the union and extrusion.
+HOLE_BUFFER_RESOLUTION = 16
+
+
+def _cell_dot_offsets(settings: CardSettings) -> np.ndarray:
+    """
+    Offsets of the six braille dots from their cell center.
+
+    Dots are numbered down the left column (1-3) then the right column (4-6).
+
+    Returns:
+        (6, 2) array of (dx, dy) in dot-index order
+    """
+    half = settings.dot_spacing / 2
+    ds = settings.dot_spacing
+    return np.array([[-half, ds], [-half, 0.0], [-half, -ds], [half, ds], [half, 0.0], [half, -ds]])
+
+
+def _counter_dot_centers(params: CardSettings, z: float) -> np.ndarray:
+    """
+    Recess centers for every dot of every braille cell on a universal counter plate.
+
+    Cells use the same layout as the embossing plate: the reserved marker columns are
+    skipped (the square placeholder shifts braille one column right when indicator
+    letters are on) and all six dots of each cell are included.
+
+    Returns:
+        (N, 3) array ordered by row, then column, then dot index, all at height z
+    """
+    indicator_shapes = getattr(params, 'indicator_shapes', 1)
+    reserved = 2 if indicator_shapes else 1
+    rows = np.arange(params.grid_rows)
+    cols = np.arange(max(params.grid_columns - reserved, 0))
+    cell_y = params.card_height - params.top_margin - (rows * params.line_spacing) + params.braille_y_adjust
+    cell_x = (
+        params.left_margin + ((cols + (1 if indicator_shapes else 0)) * params.cell_spacing) + params.braille_x_adjust
+    )
+    cell_centers = np.stack(np.meshgrid(cell_x, cell_y), axis=-1).reshape(-1, 2)
+    dot_xy = (cell_centers[:, None, :] + _cell_dot_offsets(params)[None, :, :]).reshape(-1, 2)
+    return np.column_stack([dot_xy, np.full(len(dot_xy), z)])
+
+
+def _hole_disks_are_disjoint(settings: CardSettings, hole_radius: float) -> bool:
+    """
+    Return True when no two counter plate holes can touch.
+
+    The closest hole centers are dot_spacing apart inside a cell, cell_spacing - dot_spacing
+    apart across neighbouring cells and line_spacing - 2 * dot_spacing apart across rows.
+    """
+    ds = settings.dot_spacing
+    closest = min(ds, settings.cell_spacing - ds, settings.line_spacing - 2 * ds)
+    return closest > 2 * hole_radius
+
+
+def _hole_disks(hole_centers: np.ndarray, hole_radius: float, settings: CardSettings):
+    """
+    Buffer every hole center into a disk with vectorized shapely calls.
+
+    Disjoint disks are wrapped in a MultiPolygon as-is, which the difference can consume
+    directly; layouts where holes could overlap are unioned first to stay valid.
+
+    Args:
+        hole_centers: (N, 2) array of hole centers
+        hole_radius: Radius of each circular hole
+        settings: Card settings used to decide whether the holes can overlap
+
+    Returns:
+        Shapely geometry covering all holes
+    """
+    disks = shapely.buffer(shapely.points(hole_centers), hole_radius, quad_segs=HOLE_BUFFER_RESOLUTION)
+    if _hole_disks_are_disjoint(settings, hole_radius):
+        return shapely.multipolygons(disks)
+    return shapely.union_all(disks)
+
+
+def _row_markers_are_disjoint(settings: CardSettings) -> bool:
+    """
+    Return True when the counter plate row markers can never touch each other.
+
+    Triangles and line ends are 2 * dot_spacing tall, so markers in different rows
+    are separate when line_spacing exceeds that. In a row, the line end (one dot
+    spacing wide, starting at its cell center) and the next column's triangle
+    (one dot spacing wide, centered on its cell) are cell_spacing - 1.5 * dot_spacing apart.
+    """
+    ds = settings.dot_spacing
+    return settings.line_spacing > 2 * ds and settings.cell_spacing > 1.5 * ds
+
+
+def _combine_row_markers(marker_meshes, settings: CardSettings):
+    """
+    Merge counter plate row markers into a single cutter mesh.
+
+    Disjoint closed solids are simply stacked with concatenate, skipping an N-way
+    boolean union; layouts where markers could overlap still use mesh_union.
+    Returns None when there are no markers.
+    """
+    if not marker_meshes:
+        return None
+    if len(marker_meshes) == 1:
+        return marker_meshes[0]
+    if _row_markers_are_disjoint(settings):
+        return trimesh.util.concatenate(marker_meshes)
+    return mesh_union(marker_meshes)
+
+
+def _combine_recesses(recess_meshes, recess_radius: float, settings: CardSettings):
+    """
+    Merge counter plate dot recess tools into a single cutter mesh.
+
+    Like _combine_row_markers: recesses no wider than recess_radius around their dot
+    centers that cannot reach a neighbouring dot's recess are stacked with concatenate,
+    skipping an N-way boolean union; layouts where they could overlap still use mesh_union.
+    """
+    if len(recess_meshes) == 1:
+        return recess_meshes[0]
+    if _hole_disks_are_disjoint(settings, recess_radius):
+        return trimesh.util.concatenate(recess_meshes)
+    return mesh_union(recess_meshes)
+
 
 def create_positive_plate_mesh(lines, grade='g1', settings=None, original_lines=None):
     """
@@ -53,67 +173,17 @@ def create_positive_plate_mesh(lines, grade='g1', settings=None, original_lines=
     base.apply_translation((settings.card_width / 2, settings.card_height / 2, settings.card_thickness / 2))
 
     meshes = [base]
-    marker_meshes = []  # Store markers separately for subtraction
-
-    # Dot positioning constants
-    dot_col_offsets = [-settings.dot_spacing / 2, settings.dot_spacing / 2]
-    dot_row_offsets = [settings.dot_spacing, 0, -settings.dot_spacing]
-    dot_positions = [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]  # Map dot index (0-5) to [row, col]
-
-    # Add end-of-row text/number indicators and triangle markers for ALL rows (not just those with content)
-    for row_num in range(settings.grid_rows):
-        # Calculate Y position for this row
-        y_pos = (
-            settings.card_height - settings.top_margin - (row_num * settings.line_spacing) + settings.braille_y_adjust
-        )
-
-        if getattr(settings, 'indicator_shapes', 1):
-            # Add indicator letter at the first cell position (column 0), gated by the
-            # Indicator Letters toggle
-            # Calculate X position for the first column
-            x_pos_first = settings.left_margin + settings.braille_x_adjust
 
-            # Determine which character to use for beginning-of-row indicator
-            # In manual mode: first character from the corresponding manual line
-            # In auto mode: original_lines is an array of per-row indicator characters
-            logger.debug(
-                f'Row {row_num}, original_lines provided: {original_lines is not None}, length: {len(original_lines) if original_lines else 0}'
-            )
-            if original_lines and row_num < len(original_lines):
-                orig = (original_lines[row_num] or '').strip()
-                # If auto supplied a single indicator character per row, just use it
-                indicator_char = orig[0] if orig else ''
-                logger.debug(f"Row {row_num} indicator candidate: '{indicator_char}'")
-                if indicator_char and (indicator_char.isalpha() or indicator_char.isdigit()):
-                    logger.debug(f"Creating character shape for '{indicator_char}' at first cell")
-                    line_end_mesh = create_character_shape_3d(
-                        indicator_char, x_pos_first, y_pos, settings, height=1.0, for_subtraction=True
-                    )
-                else:
-                    logger.debug(f'Indicator not alphanumeric or empty, using rectangle for row {row_num}')
-                    line_end_mesh = create_card_line_end_marker_3d(
-                        x_pos_first, y_pos, settings, height=0.5, for_subtraction=True
-                    )
-            else:
-                # No indicator info; default to rectangle
-                logger.debug(f'No indicator info for row {row_num}, using rectangle')
-                line_end_mesh = create_card_line_end_marker_3d(
-                    x_pos_first, y_pos, settings, height=0.5, for_subtraction=True
-                )
+    # (dx, dy) of each of the six dots relative to its cell center
+    dot_offsets = _cell_dot_offsets(settings)
+    # Shift text by one cell if indicators are enabled
+    text_col_shift = 1 if getattr(settings, 'indicator_shapes', 1) else 0
+    # Position Z by active dot height so the dot sits on the surface
+    dot_z = settings.card_thickness + settings.active_dot_height / 2
 
-            marker_meshes.append(line_end_mesh)
-
-        # Add triangle alignment marker at the last cell position (grid_columns - 1).
-        # Always created; the alignment triangles have no user-facing toggle.
-        x_pos_last = (
-            settings.left_margin + ((settings.grid_columns - 1) * settings.cell_spacing) + settings.braille_x_adjust
-        )
-
-        # Create triangle marker for this row (recessed for embossing plate)
-        triangle_mesh = create_card_triangle_marker_3d(x_pos_last, y_pos, settings, height=0.6, for_subtraction=True)
-        marker_meshes.append(triangle_mesh)
-
-    # Process each line in top-down order
+    # Validate and truncate each line in top-down order, collecting the cells to emboss
+    row_numbers = []
+    row_texts = []
     for row_num in range(settings.grid_rows):
         if row_num >= len(lines):
             break
@@ -124,9 +194,7 @@ def create_positive_plate_mesh(lines, grade='g1', settings=None, original_lines=
 
         # Frontend must send proper braille Unicode characters
         # Check if input contains proper braille Unicode (U+2800 to U+28FF)
-        has_braille_chars = any(ord(char) >= 0x2800 and ord(char) <= 0x28FF for char in line_text)
-
-        if has_braille_chars:
+        if has_braille_chars(line_text):
             # Input is proper braille Unicode, use it directly
             braille_text = line_text
         else:
@@ -148,131 +216,121 @@ def create_positive_plate_mesh(lines, grade='g1', settings=None, original_lines=
             )
             braille_text = braille_text[:available_columns]
 
-        # Calculate Y position for this row (top-down)
-        y_pos = (
-            settings.card_height - settings.top_margin - (row_num * settings.line_spacing) + settings.braille_y_adjust
-        )
-
-        # Process each braille character in the line
-        for col_num, braille_char in enumerate(braille_text):
-            if col_num >= available_columns:
-                break
-
-            dots = braille_to_dots(braille_char)
+        row_numbers.append(row_num)
+        row_texts.append(braille_text)
 
-            # Calculate X position for this column. Shift by one cell if indicators are enabled.
-            x_pos = (
-                settings.left_margin
-                + ((col_num + (1 if getattr(settings, 'indicator_shapes', 1) else 0)) * settings.cell_spacing)
-                + settings.braille_x_adjust
-            )
-
-            # Create dots for this cell
-            for i, dot_val in enumerate(dots):
-                if dot_val == 1:
-                    dot_pos = dot_positions[i]
-                    dot_x = x_pos + dot_col_offsets[dot_pos[1]]
-                    dot_y = y_pos + dot_row_offsets[dot_pos[0]]
-                    # Position Z by active dot height so the dot sits on the surface
-                    z = settings.card_thickness + settings.active_dot_height / 2
+    # Cell centers for every embossed cell on the card, then all active dot centers at once
+    row_lengths = np.array([len(text) for text in row_texts], dtype=int)
+    cell_rows = np.repeat(np.array(row_numbers, dtype=int), row_lengths)
+    cell_cols = np.arange(len(cell_rows)) - np.repeat(np.cumsum(row_lengths) - row_lengths, row_lengths)
+    cell_x = settings.left_margin + (cell_cols + text_col_shift) * settings.cell_spacing + settings.braille_x_adjust
+    cell_y = (
+        settings.card_height - settings.top_margin - (cell_rows * settings.line_spacing) + settings.braille_y_adjust
+    )
+    dot_mask = braille_dot_mask(''.join(row_texts))
+    dot_x = (cell_x[:, None] + dot_offsets[:, 0])[dot_mask]
+    dot_y = (cell_y[:, None] + dot_offsets[:, 1])[dot_mask]
+    dot_centers = np.column_stack([dot_x, dot_y, np.full(len(dot_x), dot_z)])
 
-                    dot_mesh = create_braille_dot(dot_x, dot_y, z, settings)
-                    meshes.append(dot_mesh)
+    # Instance every dot from the shared template in one mesh
+    dots_mesh = build_all_dots(dot_centers, settings)
+    if dots_mesh is not None:
+        meshes.append(dots_mesh)
 
     if getattr(settings, 'indicator_shapes', 1):
         logger.info(
-            f'Created positive plate with {len(meshes) - 1} braille dots, {settings.grid_rows} indicator letters, and {settings.grid_rows} triangle markers'
+            f'Created positive plate with {len(dot_centers)} braille dots, {settings.grid_rows} indicator letters, and {settings.grid_rows} triangle markers'
         )
     else:
         logger.info(
-            f'Created positive plate with {len(meshes) - 1} braille dots and {settings.grid_rows} triangle markers (indicator letters off)'
+            f'Created positive plate with {len(dot_centers)} braille dots and {settings.grid_rows} triangle markers (indicator letters off)'
         )
 
-    # Indicator recess creation using 2D operations (works in all environments)
-    # This approach creates recesses by doing 2D boolean operations then extruding
-    if marker_meshes:
-        try:
-            # 1) Build 2D base rectangle
-            base_2d = Polygon(
-                [
-                    (0.0, 0.0),
-                    (settings.card_width, 0.0),
-                    (settings.card_width, settings.card_height),
-                    (0.0, settings.card_height),
-                ]
-            )
+    # Row marker recesses (indicator letters and triangles) only carve the flat top of the card,
+    # so they are cut with 2D boolean operations and extruded instead of built as 3D meshes
+    try:
+        # 1) Build 2D base rectangle
+        base_2d = Polygon(
+            [
+                (0.0, 0.0),
+                (settings.card_width, 0.0),
+                (settings.card_width, settings.card_height),
+                (0.0, settings.card_height),
+            ]
+        )
 
-            # 2) Build 2D marker polygons for all rows (beginning indicator + triangle)
-            from shapely.ops import unary_union as _unary_union
+        # 2) Build 2D marker polygons for all rows (beginning indicator + triangle)
+        from shapely.ops import unary_union as _unary_union
 
-            subtractors = []
-            for row_num in range(settings.grid_rows):
-                y_pos = (
-                    settings.card_height
-                    - settings.top_margin
-                    - (row_num * settings.line_spacing)
-                    + settings.braille_y_adjust
-                )
-                x_first = settings.left_margin + settings.braille_x_adjust
-                x_last = (
-                    settings.left_margin
-                    + ((settings.grid_columns - 1) * settings.cell_spacing)
-                    + settings.braille_x_adjust
-                )
+        subtractors = []
+        for row_num in range(settings.grid_rows):
+            y_pos = (
+                settings.card_height
+                - settings.top_margin
+                - (row_num * settings.line_spacing)
+                + settings.braille_y_adjust
+            )
+            x_first = settings.left_margin + settings.braille_x_adjust
+            x_last = (
+                settings.left_margin + ((settings.grid_columns - 1) * settings.cell_spacing) + settings.braille_x_adjust
+            )
 
-                # Beginning-of-row indicator letter (character or rectangle fallback),
-                # gated by the Indicator Letters toggle. Matches the 3D mesh creation above.
-                if getattr(settings, 'indicator_shapes', 1):
-                    if original_lines and row_num < len(original_lines):
-                        orig = (original_lines[row_num] or '').strip()
-                        indicator_char = orig[0] if orig else ''
-                        if indicator_char and (indicator_char.isalpha() or indicator_char.isdigit()):
-                            # Use character shape
-                            char_polygon = create_character_shape_polygon(indicator_char, x_first, y_pos, settings)
-                            if char_polygon is not None:
-                                subtractors.append(char_polygon)
-                            else:
-                                subtractors.append(create_line_marker_polygon(x_first, y_pos, settings))
+            # Beginning-of-row indicator letter (character or rectangle fallback),
+            # gated by the Indicator Letters toggle.
+            # In manual mode: first character from the corresponding manual line
+            # In auto mode: original_lines is an array of per-row indicator characters
+            if getattr(settings, 'indicator_shapes', 1):
+                if original_lines and row_num < len(original_lines):
+                    orig = (original_lines[row_num] or '').strip()
+                    indicator_char = orig[0] if orig else ''
+                    logger.debug("Row %d indicator candidate: '%s'", row_num, indicator_char)
+                    if indicator_char and (indicator_char.isalpha() or indicator_char.isdigit()):
+                        # Use character shape
+                        char_polygon = create_character_shape_polygon(indicator_char, x_first, y_pos, settings)
+                        if char_polygon is not None:
+                            subtractors.append(char_polygon)
                         else:
-                            # Use rectangle
                             subtractors.append(create_line_marker_polygon(x_first, y_pos, settings))
                     else:
-                        # No indicator info; default to rectangle
+                        # Use rectangle
                         subtractors.append(create_line_marker_polygon(x_first, y_pos, settings))
+                else:
+                    # No indicator info; default to rectangle
+                    subtractors.append(create_line_marker_polygon(x_first, y_pos, settings))
 
-                # Triangle alignment marker at the end of row (always present)
-                subtractors.append(create_triangle_marker_polygon(x_last, y_pos, settings))
+            # Triangle alignment marker at the end of row (always present)
+            subtractors.append(create_triangle_marker_polygon(x_last, y_pos, settings))
 
-            subtractors_2d = _unary_union(subtractors)
+        subtractors_2d = _unary_union(subtractors)
 
-            # 3) Create two-layer plate: bottom slab + top sheet with 2D holes (recess depth)
-            # Use 1.0mm depth to accommodate character indicators (which are deeper than triangles)
-            recess_h = 1.0  # mm; matches character indicator depth
-            bottom_h = max(0.1, settings.card_thickness - recess_h)
+        # 3) Create two-layer plate: bottom slab + top sheet with 2D holes (recess depth)
+        # Use 1.0mm depth to accommodate character indicators (which are deeper than triangles)
+        recess_h = 1.0  # mm; matches character indicator depth
+        bottom_h = max(0.1, settings.card_thickness - recess_h)
 
-            # Bottom slab: full rectangle, no holes
-            bottom_slab = trimesh.creation.extrude_polygon(base_2d, height=bottom_h)
+        # Bottom slab: full rectangle, no holes
+        bottom_slab = trimesh.creation.extrude_polygon(base_2d, height=bottom_h)
 
-            # Top sheet: base minus markers, extruded to recess depth
-            top_sheet_2d = base_2d.difference(subtractors_2d)
+        # Top sheet: base minus markers, extruded to recess depth
+        top_sheet_2d = base_2d.difference(subtractors_2d)
 
-            def _extrude_multipolygon(shape_2d, height):
-                if hasattr(shape_2d, 'geoms'):
-                    parts = [trimesh.creation.extrude_polygon(g, height=height) for g in shape_2d.geoms]
-                    return trimesh.util.concatenate(parts) if parts else None
-                return trimesh.creation.extrude_polygon(shape_2d, height=height)
+        def _extrude_multipolygon(shape_2d, height):
+            if hasattr(shape_2d, 'geoms'):
+                parts = [trimesh.creation.extrude_polygon(g, height=height) for g in shape_2d.geoms]
+                return trimesh.util.concatenate(parts) if parts else None
+            return trimesh.creation.extrude_polygon(shape_2d, height=height)
 
-            top_sheet = _extrude_multipolygon(top_sheet_2d, recess_h)
-            if top_sheet is None:
-                raise RuntimeError('Top sheet extrusion produced no geometry')
-            # Position the top sheet above the bottom slab
-            top_sheet.apply_translation((0.0, 0.0, bottom_h))
+        top_sheet = _extrude_multipolygon(top_sheet_2d, recess_h)
+        if top_sheet is None:
+            raise RuntimeError('Top sheet extrusion produced no geometry')
+        # Position the top sheet above the bottom slab
+        top_sheet.apply_translation((0.0, 0.0, bottom_h))
 
-            # 4) Combine bottom slab + top sheet + dots
-            full_meshes = [bottom_slab, top_sheet] + meshes[1:]
-            return trimesh.util.concatenate(full_meshes)
-        except Exception as e2:
-            logger.warning(f'2D marker recess approach failed: {e2}')
+        # 4) Combine bottom slab + top sheet + dots
+        full_meshes = [bottom_slab, top_sheet] + meshes[1:]
+        return trimesh.util.concatenate(full_meshes)
+    except Exception as e2:
+        logger.warning(f'2D marker recess approach failed: {e2}')
 
     # Default path: combine (no marker recesses)
     return trimesh.util.concatenate(meshes)
@@ -290,13 +348,10 @@ def create_simple_negative_plate(settings: CardSettings, lines=None):
     )
 
     # Dot positioning constants (same as embossing plate)
-    dot_col_offsets = [-settings.dot_spacing / 2, settings.dot_spacing / 2]
-    dot_row_offsets = [settings.dot_spacing, 0, -settings.dot_spacing]
-    dot_positions = [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]
+    dot_offsets = _cell_dot_offsets(settings)
 
-    # Create holes for the actual text content (not all possible positions)
-    holes = []
-    total_dots = 0
+    # Hole centers for the actual text content (not all possible positions)
+    hole_centers = []
 
     # Calculate hole radius based on dot dimensions plus offset
     # Counter plate holes should be slightly larger than embossing dots for proper alignment
@@ -318,8 +373,7 @@ def create_simple_negative_plate(settings: CardSettings, lines=None):
                 continue
 
             # Check if input contains proper braille Unicode
-            has_braille_chars = any(ord(char) >= 0x2800 and ord(char) <= 0x28FF for char in line_text)
-            if not has_braille_chars:
+            if not has_braille_chars(line_text):
                 logger.warning(f'Line {row_num + 1} does not contain proper braille Unicode, skipping')
                 continue
 
@@ -331,36 +385,26 @@ def create_simple_negative_plate(settings: CardSettings, lines=None):
                 + settings.braille_y_adjust
             )
 
-            # Process each braille character in the line
-            for col_num, braille_char in enumerate(line_text):
-                if col_num >= settings.grid_columns:
-                    break
-
-                # Calculate X position for this column (same as embossing plate)
-                x_pos = settings.left_margin + (col_num * settings.cell_spacing) + settings.braille_x_adjust
-
-                # Create holes for the dots that are present in this braille character
-                dots = braille_to_dots(braille_char)
-
-                for dot_idx, dot_val in enumerate(dots):
-                    if dot_val == 1:  # Only create holes for dots that are present
-                        dot_pos = dot_positions[dot_idx]
-                        dot_x = x_pos + dot_col_offsets[dot_pos[1]]
-                        dot_y = y_pos + dot_row_offsets[dot_pos[0]]
-
-                        # Create circular hole with higher resolution
-                        hole = Point(dot_x, dot_y).buffer(hole_radius, resolution=64)
-                        holes.append(hole)
-                        total_dots += 1
+            # Holes for the dots present in each braille character, using the same
+            # column positions as the embossing plate
+            row_chars = line_text[: settings.grid_columns]
+            dot_mask = braille_dot_mask(row_chars)
+            cell_x = (
+                settings.left_margin + np.arange(len(row_chars)) * settings.cell_spacing + settings.braille_x_adjust
+            )
+            row_x = (cell_x[:, None] + dot_offsets[:, 0])[dot_mask]
+            row_y = (y_pos + dot_offsets[:, 1])[np.nonzero(dot_mask)[1]]
+            hole_centers.append(np.column_stack([row_x, row_y]))
 
-    if not holes:
+    hole_centers = np.concatenate(hole_centers) if hole_centers else np.empty((0, 2))
+    if len(hole_centers) == 0:
         logger.warning('No holes were created! Creating a plate with all possible holes as fallback')
         # Fallback: create holes for all possible positions
         return create_universal_counter_plate_fallback(settings)
 
     # Combine all holes into one multi-polygon
     try:
-        all_holes = unary_union(holes)
+        all_holes = _hole_disks(hole_centers, hole_radius, settings)
 
         # Subtract holes from base to create the plate with holes
         plate_with_holes = base_polygon.difference(all_holes)
@@ -396,41 +440,21 @@ def create_universal_counter_plate_fallback(settings: CardSettings):
         [(0, 0), (settings.card_width, 0), (settings.card_width, settings.card_height), (0, settings.card_height)]
     )
 
-    # Dot positioning constants
-    dot_col_offsets = [-settings.dot_spacing / 2, settings.dot_spacing / 2]
-    dot_row_offsets = [settings.dot_spacing, 0, -settings.dot_spacing]
-    dot_positions = [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]
-
-    # Create holes for ALL possible dot positions (312 holes total)
-    holes = []
-    total_dots = 0
-
     # Calculate hole radius
     hole_radius = max(0.5, (settings.recessed_dot_base_diameter / 2))
 
-    # Generate holes for each grid position (all cells, all dots)
-    for row in range(settings.grid_rows):
-        # Calculate Y position for this row (same as embossing plate)
-        y_pos = settings.card_height - settings.top_margin - (row * settings.line_spacing) + settings.braille_y_adjust
-
-        for col in range(settings.grid_columns):
-            # Calculate X position for this column (same as embossing plate)
-            x_pos = settings.left_margin + (col * settings.cell_spacing) + settings.braille_x_adjust
-
-            # Create holes for ALL 6 dots in this cell
-            for dot_idx in range(6):
-                dot_pos = dot_positions[dot_idx]
-                dot_x = x_pos + dot_col_offsets[dot_pos[1]]
-                dot_y = y_pos + dot_row_offsets[dot_pos[0]]
-
-                # Create circular hole
-                hole = Point(dot_x, dot_y).buffer(hole_radius, resolution=64)
-                holes.append(hole)
-                total_dots += 1
+    # Hole centers for ALL possible dot positions (every cell, all 6 dots),
+    # using the same cell positions as the embossing plate
+    rows = np.arange(settings.grid_rows)
+    cols = np.arange(settings.grid_columns)
+    cell_y = settings.card_height - settings.top_margin - (rows * settings.line_spacing) + settings.braille_y_adjust
+    cell_x = settings.left_margin + (cols * settings.cell_spacing) + settings.braille_x_adjust
+    cell_centers = np.stack(np.meshgrid(cell_x, cell_y), axis=-1).reshape(-1, 2)
+    hole_centers = (cell_centers[:, None, :] + _cell_dot_offsets(settings)[None, :, :]).reshape(-1, 2)
 
     # Combine and subtract holes
     try:
-        all_holes = unary_union(holes)
+        all_holes = _hole_disks(hole_centers, hole_radius, settings)
         plate_with_holes = base_polygon.difference(all_holes)
 
         # Extrude to 3D
@@ -488,60 +512,22 @@ def build_counter_plate_hemispheres(params: CardSettings) -> trimesh.Trimesh:
         f'Creating counter plate base: {params.card_width}mm x {params.card_height}mm x {params.plate_thickness}mm'
     )
 
-    # Dot positioning constants (same as embossing plate)
-    dot_col_offsets = [-params.dot_spacing / 2, params.dot_spacing / 2]
-    dot_row_offsets = [params.dot_spacing, 0, -params.dot_spacing]
-    dot_positions = [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]  # Map dot index (0-5) to [row, col]
-
     # Calculate hemisphere radius including the counter plate offset
-    try:
-        counter_base = float(getattr(params, 'hemi_counter_dot_base_diameter', params.counter_dot_base_diameter))
-    except Exception:
-        counter_base = params.emboss_dot_base_diameter + params.counter_plate_dot_size_offset
+    counter_base = float(params.hemi_counter_dot_base_diameter)
     hemisphere_radius = counter_base / 2
     logger.debug(
         f'Hemisphere radius: {hemisphere_radius:.3f}mm (base: {params.emboss_dot_base_diameter}mm + offset: {params.counter_plate_dot_size_offset}mm)'
     )
 
-    # Create icospheres (hemispheres) for ALL possible dot positions
-    sphere_meshes = []
-    total_spheres = 0
-
-    # Generate spheres for each grid position
-    for row in range(params.grid_rows):
-        # Calculate Y position for this row (same as embossing plate, using safe margin)
-        y_pos = params.card_height - params.top_margin - (row * params.line_spacing) + params.braille_y_adjust
-
-        # Process columns (reserve 2 when indicator letters are on, 1 for the
-        # always-present alignment triangle when off)
-        reserved = 2 if getattr(params, 'indicator_shapes', 1) else 1
-        for col in range(params.grid_columns - reserved):
-            # Calculate X position for this column (shift by one past the square marker
-            # when indicator letters are enabled)
-            x_pos = (
-                params.left_margin
-                + ((col + (1 if getattr(params, 'indicator_shapes', 1) else 0)) * params.cell_spacing)
-                + params.braille_x_adjust
-            )
-
-            # Create spheres for ALL 6 dots in this cell
-            for dot_idx in range(6):
-                dot_pos = dot_positions[dot_idx]
-                dot_x = x_pos + dot_col_offsets[dot_pos[1]]
-                dot_y = y_pos + dot_row_offsets[dot_pos[0]]
-
-                # Create an icosphere with the calculated hemisphere radius
-                # Use hemisphere_subdivisions parameter to control mesh density
-                sphere = trimesh.creation.icosphere(
-                    subdivisions=params.hemisphere_subdivisions, radius=hemisphere_radius
-                )
-                # Position the sphere so its equator lies at the top surface (z = plate_thickness)
-                z_pos = params.plate_thickness
-                sphere.apply_translation((dot_x, dot_y, z_pos))
-                sphere_meshes.append(sphere)
-                total_spheres += 1
-
-    logger.debug(f'Created {total_spheres} hemispheres for counter plate')
+    # Create icospheres (hemispheres) for ALL possible dot positions. Every sphere is the same,
+    # so build it once (use hemisphere_subdivisions parameter to control mesh density) and
+    # place translated copies
+    sphere_template = trimesh.creation.icosphere(subdivisions=params.hemisphere_subdivisions, radius=hemisphere_radius)
+    # Generate spheres for each grid position (same as embossing plate, using safe margin), with
+    # each equator on the top surface (z = plate_thickness)
+    sphere_centers = _counter_dot_centers(params, params.plate_thickness)
+    sphere_meshes = instance_meshes(sphere_template, sphere_centers)
+    logger.debug(f'Created {len(sphere_meshes)} hemispheres for counter plate')
 
     # Create square marker recesses (gated by the Indicator Letters toggle) and
     # triangle alignment marker recesses (always) for ALL rows
@@ -583,48 +569,23 @@ def build_counter_plate_hemispheres(params: CardSettings) -> trimesh.Trimesh:
             logger.debug(f'Attempting boolean operations with {engine_name} engine...')
 
             # Union all spheres together for more efficient subtraction
-            if len(sphere_meshes) == 1:
-                union_spheres = sphere_meshes[0]
-            else:
-                logger.debug('Unioning spheres...')
-                union_spheres = mesh_union(sphere_meshes)
-
-            # Union all triangles (these will be used for subtraction into the plate)
-            union_triangles = None
-            if triangle_meshes:
-                logger.debug(f'Unioning {len(triangle_meshes)} triangles (for subtraction)...')
-                if len(triangle_meshes) == 1:
-                    union_triangles = triangle_meshes[0]
-                else:
-                    union_triangles = mesh_union(triangle_meshes)
+            logger.debug('Combining spheres...')
+            union_spheres = _combine_recesses(sphere_meshes, hemisphere_radius, params)
 
-            # Union all line end markers
-            if line_end_meshes:
-                logger.debug(f'Unioning {len(line_end_meshes)} line end markers...')
-                if len(line_end_meshes) == 1:
-                    union_line_ends = line_end_meshes[0]
-                else:
-                    union_line_ends = mesh_union(line_end_meshes)
-
-            # Combine cutouts (spheres and line ends) for subtraction
-            logger.debug('Combining cutouts for subtraction...')
-            cutouts_list = [union_spheres]
-            if line_end_meshes:
-                cutouts_list.append(union_line_ends)
-            if union_triangles is not None:
-                cutouts_list.append(union_triangles)
-
-            if len(cutouts_list) > 1:
-                all_cutouts = mesh_union(cutouts_list)
-            else:
-                all_cutouts = cutouts_list[0]
+            # Merge line end markers and triangles (these will be used for subtraction into the plate)
+            logger.debug(f'Combining {len(line_end_meshes)} line end markers and {len(triangle_meshes)} triangles...')
+            union_markers = _combine_row_markers(line_end_meshes + triangle_meshes, params)
 
             logger.debug('Subtracting cutouts from plate...')
-            # Subtract the cutouts (spheres, line ends, and triangles) from the plate
-            counter_plate_mesh = mesh_difference([plate_mesh, all_cutouts])
+            # Subtract the cutouts (spheres, line ends, and triangles) from the plate in one
+            # difference; the boolean engine unions the cutters as part of the same evaluation
+            cutouts_list = [union_spheres]
+            if union_markers is not None:
+                cutouts_list.append(union_markers)
+            counter_plate_mesh = mesh_difference([plate_mesh] + cutouts_list)
 
             # Verify the mesh is watertight
-            if not counter_plate_mesh.is_watertight:
+            if not is_manifold_result(counter_plate_mesh) and not counter_plate_mesh.is_watertight:
                 logger.debug('Counter plate mesh not watertight, attempting to fix...')
                 counter_plate_mesh.fill_holes()
                 if counter_plate_mesh.is_watertight:
@@ -646,17 +607,19 @@ def build_counter_plate_hemispheres(params: CardSettings) -> trimesh.Trimesh:
                 logger.warning('Trying next engine...')
                 continue
 
-    # Final fallback: subtract spheres and triangles one by one (slower but more reliable)
+    # Final fallback: union spheres pairwise, then subtract the sphere groups and triangles
+    # one by one (slower but more reliable)
     try:
         logger.debug('Attempting individual sphere and triangle subtraction...')
         counter_plate_mesh = plate_mesh.copy()
 
-        for i, sphere in enumerate(sphere_meshes):
+        sphere_groups = pairwise_union(sphere_meshes)
+        for i, sphere in enumerate(sphere_groups):
             try:
-                logger.debug(f'Subtracting sphere {i + 1}/{len(sphere_meshes)}...')
+                logger.debug(f'Subtracting sphere group {i + 1}/{len(sphere_groups)}...')
                 counter_plate_mesh = mesh_difference([counter_plate_mesh, sphere])
             except Exception as sphere_error:
-                logger.warning(f'Failed to subtract sphere {i + 1}: {sphere_error}')
+                logger.warning(f'Failed to subtract sphere group {i + 1}: {sphere_error}')
                 continue
 
         # Subtract triangles individually (recess them)
@@ -678,7 +641,7 @@ def build_counter_plate_hemispheres(params: CardSettings) -> trimesh.Trimesh:
                 continue
 
         # Try to fix the mesh
-        if not counter_plate_mesh.is_watertight:
+        if not is_manifold_result(counter_plate_mesh) and not counter_plate_mesh.is_watertight:
             counter_plate_mesh.fill_holes()
 
         logger.debug(
@@ -708,15 +671,8 @@ def build_counter_plate_bowl(params: CardSettings) -> trimesh.Trimesh:
     plate_mesh = trimesh.creation.box(extents=(params.card_width, params.card_height, params.plate_thickness))
     plate_mesh.apply_translation((params.card_width / 2, params.card_height / 2, params.plate_thickness / 2))
 
-    dot_col_offsets = [-params.dot_spacing / 2, params.dot_spacing / 2]
-    dot_row_offsets = [params.dot_spacing, 0, -params.dot_spacing]
-    dot_positions = [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]
-
     # Inputs
-    a = (
-        float(getattr(params, 'bowl_counter_dot_base_diameter', getattr(params, 'counter_dot_base_diameter', 1.6)))
-        / 2.0
-    )
+    a = float(params.bowl_counter_dot_base_diameter) / 2.0
     h = float(getattr(params, 'counter_dot_depth', 0.6))
     # Guard against zero or negative depth
     if h <= max(0.0, float(getattr(params, 'epsilon_mm', 0.001))):
@@ -726,31 +682,13 @@ def build_counter_plate_bowl(params: CardSettings) -> trimesh.Trimesh:
     # Compute sphere radius from opening radius and depth: R = (a^2 + h^2) / (2h)
     R = (a * a + h * h) / (2.0 * h)
 
-    # Build spheres
-    sphere_meshes = []
-    total_spheres = 0
-    for row in range(params.grid_rows):
-        y_pos = params.card_height - params.top_margin - (row * params.line_spacing) + params.braille_y_adjust
-        reserved = 2 if getattr(params, 'indicator_shapes', 1) else 1
-        for col in range(params.grid_columns - reserved):
-            x_pos = (
-                params.left_margin
-                + ((col + (1 if getattr(params, 'indicator_shapes', 1) else 0)) * params.cell_spacing)
-                + params.braille_x_adjust
-            )
-            for dot_idx in range(6):
-                dot_pos = dot_positions[dot_idx]
-                dot_x = x_pos + dot_col_offsets[dot_pos[1]]
-                dot_y = y_pos + dot_row_offsets[dot_pos[0]]
-
-                sphere = trimesh.creation.icosphere(subdivisions=params.hemisphere_subdivisions, radius=R)
-                # Place center below the surface by c = R - h
-                zc = params.plate_thickness - (R - h)
-                sphere.apply_translation((dot_x, dot_y, zc))
-                sphere_meshes.append(sphere)
-                total_spheres += 1
-
-    logger.debug(f'Created {total_spheres} bowl caps for counter plate (a={a:.3f}mm, h={h:.3f}mm, R={R:.3f}mm)')
+    # Build spheres: every cap is the same sphere, so build it once and place translated copies
+    sphere_template = trimesh.creation.icosphere(subdivisions=params.hemisphere_subdivisions, radius=R)
+    # Place center below the surface by c = R - h
+    zc = params.plate_thickness - (R - h)
+    sphere_centers = _counter_dot_centers(params, zc)
+    sphere_meshes = instance_meshes(sphere_template, sphere_centers)
+    logger.debug(f'Created {len(sphere_meshes)} bowl caps for counter plate (a={a:.3f}mm, h={h:.3f}mm, R={R:.3f}mm)')
 
     # Markers (same as hemispheres): square gated by Indicator Letters toggle, triangle always
     line_end_meshes = []
@@ -776,37 +714,17 @@ def build_counter_plate_bowl(params: CardSettings) -> trimesh.Trimesh:
             engine_name = engine if engine else 'trimesh-default'
             logger.debug(f'Bowl boolean ops with {engine_name}...')
 
-            if len(sphere_meshes) == 1:
-                union_spheres = sphere_meshes[0]
-            else:
-                union_spheres = mesh_union(sphere_meshes)
+            # The bowl spheres are wider than their openings, so overlap is judged on R
+            union_spheres = _combine_recesses(sphere_meshes, R, params)
 
-            union_triangles = None
-            if triangle_meshes:
-                if len(triangle_meshes) == 1:
-                    union_triangles = triangle_meshes[0]
-                else:
-                    union_triangles = mesh_union(triangle_meshes)
-
-            if line_end_meshes:
-                if len(line_end_meshes) == 1:
-                    union_line_ends = line_end_meshes[0]
-                else:
-                    union_line_ends = mesh_union(line_end_meshes)
+            union_markers = _combine_row_markers(line_end_meshes + triangle_meshes, params)
 
+            # One difference subtracts spheres and markers together
             cutouts_list = [union_spheres]
-            if line_end_meshes:
-                cutouts_list.append(union_line_ends)
-            if union_triangles is not None:
-                cutouts_list.append(union_triangles)
-
-            if len(cutouts_list) > 1:
-                all_cutouts = mesh_union(cutouts_list)
-            else:
-                all_cutouts = cutouts_list[0]
-
-            counter_plate_mesh = mesh_difference([plate_mesh, all_cutouts])
-            if not counter_plate_mesh.is_watertight:
+            if union_markers is not None:
+                cutouts_list.append(union_markers)
+            counter_plate_mesh = mesh_difference([plate_mesh] + cutouts_list)
+            if not is_manifold_result(counter_plate_mesh) and not counter_plate_mesh.is_watertight:
                 counter_plate_mesh.fill_holes()
             logger.debug(f'Counter plate with bowl recess completed: {len(counter_plate_mesh.vertices)} verts')
             return counter_plate_mesh
@@ -830,12 +748,8 @@ def build_counter_plate_cone(params: CardSettings) -> trimesh.Trimesh:
     plate_mesh = trimesh.creation.box(extents=(params.card_width, params.card_height, params.plate_thickness))
     plate_mesh.apply_translation((params.card_width / 2, params.card_height / 2, params.plate_thickness / 2))
 
-    dot_col_offsets = [-params.dot_spacing / 2, params.dot_spacing / 2]
-    dot_row_offsets = [params.dot_spacing, 0, -params.dot_spacing]
-    dot_positions = [[0, 0], [1, 0], [2, 0], [0, 1], [1, 1], [2, 1]]
-
     # Inputs
-    base_d = float(getattr(params, 'cone_counter_dot_base_diameter', getattr(params, 'counter_dot_base_diameter', 1.6)))
+    base_d = float(params.cone_counter_dot_base_diameter)
     hat_d = float(getattr(params, 'cone_counter_dot_flat_hat', 0.4))
     height_h = float(getattr(params, 'cone_counter_dot_height', 0.8))
     base_r = max(params.epsilon_mm, base_d / 2.0)
@@ -849,71 +763,13 @@ def build_counter_plate_cone(params: CardSettings) -> trimesh.Trimesh:
     segments = int(getattr(params, 'cone_segments', 16))
     segments = max(8, min(32, segments))  # Clamp to valid range
 
-    # OPTIMIZATION: Pre-calculate common values to avoid repeated computation
-    angles = np.linspace(0, 2 * np.pi, segments, endpoint=False)
-    cos_angles = np.cos(angles)
-    sin_angles = np.sin(angles)
+    # Every recess is the same frustum: build and validate it once, then translate copies
+    cone_template = cone_recess_template(base_r, hat_r, height_h, segments)
 
     # Create conical frustum solids for subtraction using optimized approach
-    recess_meshes = []
-    total_recess = 0
-    for row in range(params.grid_rows):
-        y_pos = params.card_height - params.top_margin - (row * params.line_spacing) + params.braille_y_adjust
-        reserved = 2 if getattr(params, 'indicator_shapes', 1) else 1
-        for col in range(params.grid_columns - reserved):
-            x_pos = (
-                params.left_margin
-                + ((col + (1 if getattr(params, 'indicator_shapes', 1) else 0)) * params.cell_spacing)
-                + params.braille_x_adjust
-            )
-            for dot_idx in range(6):
-                dot_pos = dot_positions[dot_idx]
-                dot_x = x_pos + dot_col_offsets[dot_pos[1]]
-                dot_y = y_pos + dot_row_offsets[dot_pos[0]]
-
-                # OPTIMIZATION: Use pre-calculated trigonometric values
-                top_ring = np.column_stack([base_r * cos_angles, base_r * sin_angles, np.zeros_like(angles)])
-                bot_ring = np.column_stack([hat_r * cos_angles, hat_r * sin_angles, -height_h * np.ones_like(angles)])
-                vertices = np.vstack([top_ring, bot_ring, [[0, 0, 0]], [[0, 0, -height_h]]])
-                top_center_index = 2 * segments
-                bot_center_index = 2 * segments + 1
-
-                # OPTIMIZATION: Pre-allocate faces array for better performance
-                faces = np.zeros((segments * 4, 3), dtype=int)
-                face_idx = 0
-
-                for i in range(segments):
-                    j = (i + 1) % segments
-                    ti = i
-                    tj = j
-                    bi = segments + i
-                    bj = segments + j
-                    # side quads as two triangles (ensure correct orientation for outward normals)
-                    faces[face_idx] = [ti, bi, tj]
-                    faces[face_idx + 1] = [bi, bj, tj]
-                    # top cap (at z=0) - outward normal pointing up
-                    faces[face_idx + 2] = [top_center_index, ti, tj]
-                    # bottom cap (at z=-height_h) - outward normal pointing down
-                    faces[face_idx + 3] = [bot_center_index, bj, bi]
-                    face_idx += 4
-
-                # OPTIMIZATION: Create mesh with minimal processing and skip extensive repair operations
-                frustum = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
-
-                # OPTIMIZATION: Only perform essential mesh validation
-                if not frustum.is_volume:
-                    try:
-                        frustum.fix_normals()
-                        if not frustum.is_watertight:
-                            frustum.fill_holes()
-                    except Exception:
-                        # Skip extensive repair operations for better performance
-                        pass
-
-                # Position with slight overlap so top cap is slightly above the surface to ensure robust boolean subtraction
-                frustum.apply_translation((dot_x, dot_y, params.plate_thickness + overcut_z))
-                recess_meshes.append(frustum)
-                total_recess += 1
+    # Position with slight overlap so top cap is slightly above the surface to ensure robust boolean subtraction
+    recess_centers = _counter_dot_centers(params, params.plate_thickness + overcut_z)
+    recess_meshes = instance_meshes(cone_template, recess_centers)
 
     # Markers (same as hemispheres/bowl): square gated by Indicator Letters toggle, triangle always
     line_end_meshes = []
@@ -933,62 +789,25 @@ def build_counter_plate_cone(params: CardSettings) -> trimesh.Trimesh:
         return plate_mesh
 
     logger.debug(
-        f'Created {total_recess} cone frusta for counter plate (base_d={base_d:.3f}mm, hat_d={hat_d:.3f}mm, h={height_h:.3f}mm)'
+        f'Created {len(recess_meshes)} cone frusta for counter plate (base_d={base_d:.3f}mm, hat_d={hat_d:.3f}mm, h={height_h:.3f}mm)'
     )
 
     # OPTIMIZATION: Use union operations like bowl/hemisphere for better performance
     try:
-        # Union all recess meshes first (like bowl/hemisphere approach)
-        if len(recess_meshes) == 1:
-            union_recesses = recess_meshes[0]
-        else:
-            # Use trimesh default engine (serverless-compatible)
-            engines_to_try = [None]  # None uses trimesh built-in boolean engine
-            union_recesses = None
-            for engine in engines_to_try:
-                try:
-                    engine_name = engine if engine else 'trimesh-default'
-                    logger.debug(f'Cone union with {engine_name}...')
-                    union_recesses = mesh_union(recess_meshes)
-                    break
-                except Exception as e:
-                    logger.warning(f'Failed to union with {engine_name}: {e}')
-                    continue
-
-            if union_recesses is None:
-                raise Exception('All union engines failed')
-
-        # Union markers
-        union_triangles = None
-        if triangle_meshes:
-            if len(triangle_meshes) == 1:
-                union_triangles = triangle_meshes[0]
-            else:
-                union_triangles = mesh_union(triangle_meshes)
+        # Union all recess meshes first (like bowl/hemisphere approach); the frusta are
+        # widest at their base radius
+        union_recesses = _combine_recesses(recess_meshes, base_r, params)
 
-        union_line_ends = None
-        if line_end_meshes:
-            if len(line_end_meshes) == 1:
-                union_line_ends = line_end_meshes[0]
-            else:
-                union_line_ends = mesh_union(line_end_meshes)
+        # Merge markers
+        union_markers = _combine_row_markers(line_end_meshes + triangle_meshes, params)
 
-        # Combine all cutouts
+        # Single difference operation over all cutouts (much faster than individual subtractions)
         cutouts_list = [union_recesses]
-        if union_line_ends is not None:
-            cutouts_list.append(union_line_ends)
-        if union_triangles is not None:
-            cutouts_list.append(union_triangles)
-
-        # Single difference operation (much faster than individual subtractions)
-        if len(cutouts_list) > 1:
-            union_cutouts = mesh_union(cutouts_list)
-        else:
-            union_cutouts = cutouts_list[0]
-
-        result_mesh = mesh_difference([plate_mesh, union_cutouts])
+        if union_markers is not None:
+            cutouts_list.append(union_markers)
+        result_mesh = mesh_difference([plate_mesh] + cutouts_list)
 
-        if not result_mesh.is_watertight:
+        if not is_manifold_result(result_mesh) and not result_mesh.is_watertight:
             result_mesh.fill_holes()
         logger.debug(f'Cone recess (optimized union approach) completed: {len(result_mesh.vertices)} verts')
         return result_mesh
@@ -997,16 +816,17 @@ def build_counter_plate_cone(params: CardSettings) -> trimesh.Trimesh:
         logger.error(f'Cone recess union approach failed: {e_final}')
         logger.warning('Falling back to individual subtraction method.')
 
-        # Fallback to individual subtraction if union approach fails
+        # Fallback to individual subtraction of pairwise-unioned frustum groups if union approach fails
         try:
             result_mesh = plate_mesh.copy()
-            for i, recess in enumerate(recess_meshes):
+            recess_groups = pairwise_union(recess_meshes)
+            for i, recess in enumerate(recess_groups):
                 try:
                     if (i % 50) == 0:
-                        logger.debug(f'Subtracting cone frustum {i + 1}/{len(recess_meshes)}...')
+                        logger.debug(f'Subtracting cone frustum group {i + 1}/{len(recess_groups)}...')
                     result_mesh = mesh_difference([result_mesh, recess])
                 except Exception as e_sub:
-                    logger.warning(f'Failed to subtract frustum {i + 1}: {e_sub}')
+                    logger.warning(f'Failed to subtract frustum group {i + 1}: {e_sub}')
                     continue
             for i, triangle in enumerate(triangle_meshes):
                 try:
@@ -1020,7 +840,7 @@ def build_counter_plate_cone(params: CardSettings) -> trimesh.Trimesh:
                 except Exception as e_line:
                     logger.warning(f'Failed to subtract line end {i + 1}: {e_line}')
                     continue
-            if not result_mesh.is_watertight:
+            if not is_manifold_result(result_mesh) and not result_mesh.is_watertight:
                 result_mesh.fill_holes()
             logger.debug(f'Cone recess (fallback individual subtraction) completed: {len(result_mesh.vertices)} verts')
             return result_mesh
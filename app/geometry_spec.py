@@ -237,12 +237,7 @@ def _create_dot_spec(
     if shape_type == 'hemisphere':
         # Hemisphere for counter plates
         # Use hemi_counter_dot_base_diameter to match CardSettings
-        try:
-            hemi_base = float(
-                getattr(settings, 'hemi_counter_dot_base_diameter', getattr(settings, 'counter_dot_base_diameter', 1.6))
-            )
-        except Exception:
-            hemi_base = 1.6
+        hemi_base = float(settings.hemi_counter_dot_base_diameter)
         radius = hemi_base / 2
         return {
             'type': 'rounded',
@@ -260,12 +255,7 @@ def _create_dot_spec(
     elif shape_type == 'bowl':
         # Bowl (spherical cap) for counter plates
         # Use bowl_counter_dot_base_diameter and counter_dot_depth to match CardSettings
-        try:
-            bowl_base = float(
-                getattr(settings, 'bowl_counter_dot_base_diameter', getattr(settings, 'counter_dot_base_diameter', 1.8))
-            )
-        except Exception:
-            bowl_base = 1.8
+        bowl_base = float(settings.bowl_counter_dot_base_diameter)
         radius = bowl_base / 2
         depth = float(getattr(settings, 'counter_dot_depth', 0.8))
         return {
@@ -284,9 +274,7 @@ def _create_dot_spec(
     elif shape_type == 'cone':
         # Cone frustum for counter plates
         # Use cone_counter_dot parameters to match CardSettings and backend.py
-        base_dia = float(
-            getattr(settings, 'cone_counter_dot_base_diameter', getattr(settings, 'counter_dot_base_diameter', 1.6))
-        )
+        base_dia = float(settings.cone_counter_dot_base_diameter)
         top_dia = float(getattr(settings, 'cone_counter_dot_flat_hat', 0.4))
         height = float(getattr(settings, 'cone_counter_dot_height', 0.8))
         return {
@@ -592,7 +580,7 @@ def extract_cylinder_geometry_spec(
                 spec['markers'].append(char_spec)
 
             # Process braille characters (dots) only if the row has braille
-            has_braille = any(0x2800 <= ord(c) <= 0x28FF for c in line) if line else False
+            has_braille = any('\u2800' <= c <= '\u28ff' for c in line) if line else False
             if not has_braille:
                 continue
 
@@ -655,14 +643,7 @@ def _create_cylinder_dot_spec(
 
         if recess_shape == 0:  # Hemisphere
             # Use hemisphere counter dot base diameter
-            try:
-                hemi_base = float(
-                    getattr(
-                        settings, 'hemi_counter_dot_base_diameter', getattr(settings, 'counter_dot_base_diameter', 1.6)
-                    )
-                )
-            except Exception:
-                hemi_base = 1.6
+            hemi_base = float(settings.hemi_counter_dot_base_diameter)
             recess_radius = hemi_base / 2
             return {
                 'type': 'cylinder_dot',
@@ -679,14 +660,7 @@ def _create_cylinder_dot_spec(
             }
         elif recess_shape == 1:  # Bowl
             # Use bowl counter dot base diameter
-            try:
-                bowl_base = float(
-                    getattr(
-                        settings, 'bowl_counter_dot_base_diameter', getattr(settings, 'counter_dot_base_diameter', 1.8)
-                    )
-                )
-            except Exception:
-                bowl_base = 1.8
+            bowl_base = float(settings.bowl_counter_dot_base_diameter)
             bowl_radius = bowl_base / 2
             bowl_depth = float(getattr(settings, 'counter_dot_depth', 0.8))
             return {
@@ -705,9 +679,7 @@ def _create_cylinder_dot_spec(
             }
         else:  # Cone (recess_shape == 2)
             # Use cone counter dot parameters matching CardSettings and cylinder.py
-            base_dia = float(
-                getattr(settings, 'cone_counter_dot_base_diameter', getattr(settings, 'counter_dot_base_diameter', 1.6))
-            )
+            base_dia = float(settings.cone_counter_dot_base_diameter)
             top_dia = float(getattr(settings, 'cone_counter_dot_flat_hat', 0.4))
             cone_height = float(getattr(settings, 'cone_counter_dot_height', 0.8))
             return {
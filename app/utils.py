@@ -17,6 +17,12 @@ MM_TO_INCHES = 0.0393701  # Conversion factor
 BRAILLE_UNICODE_START = 0x2800  # ⠀
 BRAILLE_UNICODE_END = 0x28FF  # ⣿
 
+# Dots 1-6 for every pattern in the braille block, indexed by (code point - U+2800).
+# Bits 6-7 (dots 7-8) are ignored, matching the 6-dot cells we emboss.
+_BRAILLE_DOT_TABLE = tuple(
+    tuple((pattern >> i) & 1 for i in range(6)) for pattern in range(BRAILLE_UNICODE_END - BRAILLE_UNICODE_START + 1)
+)
+
 
 def setup_logging(name: str = None, level: int = None) -> logging.Logger:
     """
@@ -75,6 +81,21 @@ def is_braille_char(char: str) -> bool:
     return BRAILLE_UNICODE_START <= code <= BRAILLE_UNICODE_END
 
 
+def has_braille_chars(text: str) -> bool:
+    """
+    Check if any character of a string is in the braille Unicode block.
+
+    Compares characters as strings, which avoids creating an int per character with ord().
+
+    Args:
+        text: Line of text to scan
+
+    Returns:
+        True if at least one character is in braille Unicode range
+    """
+    return any('\u2800' <= char <= '\u28ff' for char in text)
+
+
 def safe_float(value: Any, default: float = 0.0) -> float:
     """
     Safely convert a value to float with fallback.
@@ -134,14 +155,5 @@ def braille_to_dots(braille_char: str) -> list:
             f'Expected braille Unicode range U+2800 to U+28FF.'
         )
 
-    # Extract the dot pattern (bits 0-7 for dots 1-8)
-    # The bit order is dot 1, 2, 3, 4, 5, 6, 7, 8
-    dot_pattern = code_point - 0x2800
-
-    # Convert to 6-dot pattern (dots 1-6)
-    dots = [0, 0, 0, 0, 0, 0]
-    for i in range(6):
-        if dot_pattern & (1 << i):
-            dots[i] = 1
-
-    return dots
+    # Look up the precomputed 6-dot pattern (bit order is dot 1, 2, 3, 4, 5, 6)
+    return list(_BRAILLE_DOT_TABLE[code_point - BRAILLE_UNICODE_START])
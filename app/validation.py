@@ -5,6 +5,8 @@ This module provides validation functions for incoming requests,
 ensuring security, correctness, and helpful error messages.
 """
 
+import re
+from collections.abc import Callable
 from typing import Any
 
 from app.utils import get_logger
@@ -18,6 +20,62 @@ MAX_LINES = 4
 BRAILLE_UNICODE_START = 0x2800
 BRAILLE_UNICODE_END = 0x28FF
 
+# Matches any character that is neither a braille pattern nor an ASCII space
+# (spaces represent blank braille cells).
+_NON_BRAILLE_RE = re.compile(f'[^ {chr(BRAILLE_UNICODE_START)}-{chr(BRAILLE_UNICODE_END)}]')
+
+# Characters rejected by basic input sanitization
+HARMFUL_CHARS = ('<', '>', '&', '"', "'", '\x00')
+_HARMFUL_RE = re.compile('[' + re.escape(''.join(HARMFUL_CHARS)) + ']')
+
+
+def _as_int(value: Any) -> int:
+    """Cast a setting to int, accepting float-like strings such as "2.0"."""
+    return int(float(value))
+
+
+# Allowed settings keys mapped to (caster, min, max). Unknown keys are ignored
+# (CardSettings will use defaults).
+_ALLOWED_SETTINGS: dict[str, tuple[Callable[[Any], float], float, float]] = {
+    'card_width': (float, 50, 200),
+    'card_height': (float, 30, 150),
+    'card_thickness': (float, 1, 10),
+    'grid_columns': (_as_int, 1, 20),
+    'grid_rows': (_as_int, 1, 200),
+    'cell_spacing': (float, 2, 15),
+    'line_spacing': (float, 5, 25),
+    'dot_spacing': (float, 1, 5),
+    'emboss_dot_base_diameter': (float, 0.5, 3),
+    'emboss_dot_height': (float, 0.3, 2),
+    'emboss_dot_flat_hat': (float, 0.1, 2),
+    # Rounded dome
+    'use_rounded_dots': (_as_int, 0, 1),
+    'rounded_dot_diameter': (float, 0.5, 3),
+    'rounded_dot_height': (float, 0.2, 2),
+    # New rounded dot with cone base params
+    'rounded_dot_base_diameter': (float, 0.5, 3),
+    'rounded_dot_cylinder_height': (float, 0.0, 2.0),
+    'rounded_dot_base_height': (float, 0.0, 2.0),
+    'rounded_dot_dome_height': (float, 0.1, 2.0),
+    'rounded_dot_dome_diameter': (float, 0.5, 3.0),
+    'braille_x_adjust': (float, -10, 10),
+    'braille_y_adjust': (float, -10, 10),
+    # Counter plate parameters
+    'counter_plate_dot_size_offset': (float, 0, 2),
+    'counter_dot_base_diameter': (float, 0.1, 5.0),
+    'hemi_counter_dot_base_diameter': (float, 0.1, 5.0),
+    'bowl_counter_dot_base_diameter': (float, 0.1, 5.0),
+    'hemisphere_subdivisions': (_as_int, 1, 3),
+    'cone_segments': (_as_int, 8, 32),
+    'use_bowl_recess': (_as_int, 0, 1),
+    'recess_shape': (_as_int, 0, 2),
+    'cone_counter_dot_base_diameter': (float, 0.1, 5.0),
+    'cone_counter_dot_height': (float, 0.0, 5.0),
+    'cone_counter_dot_flat_hat': (float, 0.0, 5.0),
+    'counter_dot_depth': (float, 0.0, 5.0),
+    'indicator_shapes': (_as_int, 0, 1),
+}
+
 
 class ValidationError(ValueError):
     """Custom exception for validation errors with structured details."""
@@ -60,9 +118,8 @@ def validate_lines(lines: Any) -> bool:
             )
 
         # Basic sanitization - check for potentially harmful characters
-        harmful_chars = ['<', '>', '&', '"', "'", '\x00']
-        found_harmful = [char for char in harmful_chars if char in line]
-        if found_harmful:
+        if _HARMFUL_RE.search(line):
+            found_harmful = [char for char in HARMFUL_CHARS if char in line]
             raise ValidationError(
                 f'Line {i + 1} contains invalid characters: {found_harmful}',
                 {'line_number': i + 1, 'invalid_chars': found_harmful},
@@ -94,23 +151,18 @@ def validate_braille_lines(lines: list[str], plate_type: str = 'positive') -> bo
 
     for i, line in enumerate(lines):
         if line.strip():  # Only validate non-empty lines
-            # Check each character in the line
-            for j, char in enumerate(line):
-                # Allow standard ASCII space characters which represent blank braille cells
-                if char == ' ':
-                    continue
-
-                char_code = ord(char)
-                if char_code < BRAILLE_UNICODE_START or char_code > BRAILLE_UNICODE_END:
-                    errors.append(
-                        {
-                            'line': i + 1,
-                            'position': j + 1,
-                            'character': char,
-                            'char_code': f'U+{char_code:04X}',
-                            'expected': f'U+{BRAILLE_UNICODE_START:04X} to U+{BRAILLE_UNICODE_END:04X}',
-                        }
-                    )
+            # Single regex scan per line; error records are only built for offending characters
+            for match in _NON_BRAILLE_RE.finditer(line):
+                char = match.group()
+                errors.append(
+                    {
+                        'line': i + 1,
+                        'position': match.start() + 1,
+                        'character': char,
+                        'char_code': f'U+{ord(char):04X}',
+                        'expected': f'U+{BRAILLE_UNICODE_START:04X} to U+{BRAILLE_UNICODE_END:04X}',
+                    }
+                )
 
     if errors:
         error_details = []
@@ -149,59 +201,16 @@ def validate_settings(settings_data: Any) -> bool:
     if not isinstance(settings_data, dict):
         raise ValidationError('Settings must be a dictionary', {'type': type(settings_data).__name__})
 
-    # Define allowed settings keys and their types/ranges
-    allowed_settings = {
-        'card_width': (float, 50, 200),
-        'card_height': (float, 30, 150),
-        'card_thickness': (float, 1, 10),
-        'grid_columns': (int, 1, 20),
-        'grid_rows': (int, 1, 200),
-        'cell_spacing': (float, 2, 15),
-        'line_spacing': (float, 5, 25),
-        'dot_spacing': (float, 1, 5),
-        'emboss_dot_base_diameter': (float, 0.5, 3),
-        'emboss_dot_height': (float, 0.3, 2),
-        'emboss_dot_flat_hat': (float, 0.1, 2),
-        # Rounded dome
-        'use_rounded_dots': (int, 0, 1),
-        'rounded_dot_diameter': (float, 0.5, 3),
-        'rounded_dot_height': (float, 0.2, 2),
-        # New rounded dot with cone base params
-        'rounded_dot_base_diameter': (float, 0.5, 3),
-        'rounded_dot_cylinder_height': (float, 0.0, 2.0),
-        'rounded_dot_base_height': (float, 0.0, 2.0),
-        'rounded_dot_dome_height': (float, 0.1, 2.0),
-        'rounded_dot_dome_diameter': (float, 0.5, 3.0),
-        'braille_x_adjust': (float, -10, 10),
-        'braille_y_adjust': (float, -10, 10),
-        # Counter plate parameters
-        'counter_plate_dot_size_offset': (float, 0, 2),
-        'counter_dot_base_diameter': (float, 0.1, 5.0),
-        'hemi_counter_dot_base_diameter': (float, 0.1, 5.0),
-        'bowl_counter_dot_base_diameter': (float, 0.1, 5.0),
-        'hemisphere_subdivisions': (int, 1, 3),
-        'cone_segments': (int, 8, 32),
-        'use_bowl_recess': (int, 0, 1),
-        'recess_shape': (int, 0, 2),
-        'cone_counter_dot_base_diameter': (float, 0.1, 5.0),
-        'cone_counter_dot_height': (float, 0.0, 5.0),
-        'cone_counter_dot_flat_hat': (float, 0.0, 5.0),
-        'counter_dot_depth': (float, 0.0, 5.0),
-        'indicator_shapes': (int, 0, 1),
-    }
-
     for key, value in settings_data.items():
-        if key not in allowed_settings:
+        spec = _ALLOWED_SETTINGS.get(key)
+        if spec is None:
             continue  # Ignore unknown settings (CardSettings will use defaults)
 
-        expected_type, min_val, max_val = allowed_settings[key]
+        caster, min_val, max_val = spec
 
         # Type validation with better error messages
         try:
-            if expected_type is int:  # Use 'is' for type comparison
-                value = int(float(value))  # Allow "2.0" to become int 2
-            else:
-                value = float(value)
+            value = caster(value)
         except (ValueError, TypeError) as e:
             raise ValidationError(
                 f"Setting '{key}' must be a number", {'key': key, 'value': value, 'expected_type': 'number'}
@@ -27,6 +27,9 @@ from app.validation import (
 # Configure logging for this module
 logger = get_logger(__name__)
 
+# Deployment environment, read once at import
+IS_DEVELOPMENT = os.environ.get('FLASK_ENV') == 'development'
+
 app = Flask(__name__)
 # CORS configuration - uses environment variable for production domain
 # SECURITY: CORS must be properly configured for production
@@ -43,7 +46,7 @@ if production_domain:
             logger.info(f'CORS: Added production domain: {domain}')
 
 # For development, allow localhost
-if os.environ.get('FLASK_ENV') == 'development':
+if IS_DEVELOPMENT:
     allowed_origins.extend(
         ['http://localhost:3000', 'http://127.0.0.1:3000', 'http://localhost:5001', 'http://127.0.0.1:5001']
     )
@@ -52,7 +55,7 @@ if os.environ.get('FLASK_ENV') == 'development':
 # SECURITY: In production without CORS configured, restrict to same-origin only
 # This is more secure than allowing all origins
 if not allowed_origins:
-    if os.environ.get('FLASK_ENV') == 'development':
+    if IS_DEVELOPMENT:
         # In development without explicit config, allow localhost
         allowed_origins = ['http://localhost:5001', 'http://127.0.0.1:5001']
         logger.warning('CORS: Development mode with no PRODUCTION_DOMAIN - allowing localhost only')
@@ -85,16 +88,19 @@ CORS(app, origins=allowed_origins, supports_credentials=cors_supports_credential
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024  # 100KB max (reduced from 1MB)
 
 
-# Security headers middleware
-@app.after_request
-def set_security_headers(response):
-    """Add comprehensive security headers to all responses."""
-    # If already in cache (304), skip modifying headers
-    if response.status_code == 304:
-        return response
+def _build_security_headers(is_development: bool) -> dict[str, str]:
+    """
+    Build the static security headers added to every response.
+
+    The headers depend only on the deployment environment, so they are built
+    once at import instead of per response.
 
-    is_development = os.environ.get('FLASK_ENV') == 'development'
+    Args:
+        is_development: True when FLASK_ENV=development (plain-HTTP localhost)
 
+    Returns:
+        Mapping of header name to value
+    """
     # CSP: All client-side dependencies (Three.js, three-bvh-csg, three-mesh-bvh,
     # Manifold-3D WASM) are vendored under /static/, so no third-party CDN
     # origins are needed in connect-src or script-src. 'wasm-unsafe-eval' is
@@ -127,21 +133,38 @@ def set_security_headers(response):
     # e2e suite.
     if not is_development:
         csp_directives.append('upgrade-insecure-requests')
-    response.headers['Content-Security-Policy'] = '; '.join(csp_directives)
 
-    # Additional security headers
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'DENY'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
+    headers = {
+        'Content-Security-Policy': '; '.join(csp_directives),
+        # Additional security headers
+        'X-Content-Type-Options': 'nosniff',
+        'X-Frame-Options': 'DENY',
+        'X-XSS-Protection': '1; mode=block',
+        'Referrer-Policy': 'strict-origin-when-cross-origin',
+        'Permissions-Policy': 'geolocation=(), microphone=(), camera=()',
+    }
     # HSTS is meaningful only when the response itself was served over HTTPS;
     # most browsers ignore it on plain-HTTP responses, but compliant ones
     # warn (and some Playwright builds appear to honour it heuristically).
     # Skip it entirely in development so localhost behaves as plain HTTP.
     if not is_development:
-        response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-    response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-    response.headers['Permissions-Policy'] = 'geolocation=(), microphone=(), camera=()'
+        headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
+
+    return headers
+
+
+_SECURITY_HEADERS = _build_security_headers(IS_DEVELOPMENT)
+
+
+# Security headers middleware
+@app.after_request
+def set_security_headers(response):
+    """Add comprehensive security headers to all responses."""
+    # If already in cache (304), skip modifying headers
+    if response.status_code == 304:
+        return response
 
+    response.headers.update(_SECURITY_HEADERS)
     return response
 
 
@@ -156,8 +179,9 @@ def handle_exception(e):
     if isinstance(e, HTTPException):
         return e
 
-    # Log non-HTTP exceptions
-    app.logger.error(f'Unhandled exception: {e}')
+    # Log non-HTTP exceptions; exc_info is attached to the record and the
+    # traceback is only rendered if a handler actually emits it
+    app.logger.exception('Unhandled exception: %s', e)
     return jsonify({'error': 'Internal server error'}), 500
 
 
@@ -560,4 +584,4 @@ def geometry_spec():
 # Run the Flask development server
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
-    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_ENV') == 'development')
+    app.run(host='0.0.0.0', port=port, debug=IS_DEVELOPMENT)
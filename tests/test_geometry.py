@@ -0,0 +1,370 @@
+"""
+Tests for the optional server-side geometry modules (app.geometry).
+
+These require the dev-only geometry dependencies (numpy, trimesh, shapely)
+and are skipped when they are not installed.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('trimesh')
+pytest.importorskip('shapely')
+
+from app.geometry.dot_shapes import create_braille_dot  # noqa: E402
+from app.models import CardSettings  # noqa: E402
+
+
+@pytest.mark.parametrize('use_rounded_dots', [0, 1])
+def test_braille_dot_is_placed_at_target(use_rounded_dots):
+    """Dots built from the shared template are independent meshes positioned at (x, y, z)."""
+    settings = CardSettings(use_rounded_dots=use_rounded_dots)
+
+    first = create_braille_dot(10.0, 20.0, 2.0, settings)
+    second = create_braille_dot(-5.0, 3.0, 2.0, settings)
+
+    assert first is not second
+    assert np.allclose(first.vertices[:, :2].mean(axis=0), [10.0, 20.0], atol=0.05)
+    assert np.allclose(second.vertices[:, :2].mean(axis=0), [-5.0, 3.0], atol=0.05)
+    # Translating one dot must not move the other (template is copied, not shared)
+    assert np.allclose(first.vertices - first.vertices.mean(axis=0), second.vertices - second.vertices.mean(axis=0))
+
+
+def test_cone_dot_dimensions_match_settings():
+    """Default cone frustum spans the emboss base diameter and height."""
+    settings = CardSettings(use_rounded_dots=0)
+    dot = create_braille_dot(0.0, 0.0, 0.0, settings)
+
+    extents = dot.extents
+    assert extents[0] == pytest.approx(settings.emboss_dot_base_diameter, rel=0.02)
+    assert extents[2] == pytest.approx(settings.emboss_dot_height)
+    assert dot.is_watertight
+
+
+def test_rounded_dot_is_single_watertight_solid():
+    """Rounded dot (frustum + analytic cap) is one closed solid spanning the active dot height."""
+    settings = CardSettings(use_rounded_dots=1)
+    dot = create_braille_dot(0.0, 0.0, 0.0, settings)
+
+    assert dot.is_watertight
+    assert dot.extents[0] == pytest.approx(settings.rounded_dot_base_diameter, rel=0.02)
+    assert dot.extents[2] == pytest.approx(settings.active_dot_height)
+
+
+def test_build_all_dots_matches_individual_dots():
+    """Batched dot instancing produces the same geometry as placing dots one at a time."""
+    from app.geometry.dot_shapes import build_all_dots
+
+    settings = CardSettings()
+    centers = [(1.0, 2.0, 2.4), (4.0, -1.0, 2.4), (0.0, 0.0, 0.0)]
+
+    batched = build_all_dots(centers, settings)
+    singles = [create_braille_dot(x, y, z, settings) for x, y, z in centers]
+
+    assert len(batched.faces) == sum(len(m.faces) for m in singles)
+    assert np.allclose(batched.vertices, np.vstack([m.vertices for m in singles]))
+    assert build_all_dots([], settings) is None
+
+
+def test_cached_marker_prisms_are_independent_copies():
+    """Row markers reuse one extrusion but each call returns its own translated mesh."""
+    from app.geometry.braille_layout import create_card_line_end_marker_3d, create_card_triangle_marker_3d
+
+    settings = CardSettings()
+    for create in (create_card_triangle_marker_3d, create_card_line_end_marker_3d):
+        first = create(10.0, 20.0, settings, height=0.5, for_subtraction=True)
+        second = create(10.0, 5.0, settings, height=0.5, for_subtraction=True)
+
+        assert first is not second
+        assert np.allclose(first.vertices[:, 1] - second.vertices[:, 1], 15.0)
+        assert first.bounds[0][2] == pytest.approx(settings.card_thickness - 0.1)
+        assert first.extents[2] == pytest.approx(1.0)
+
+
+def test_batched_cylinder_frames_match_scalar_frames():
+    """The batched cylinder frame helper agrees with the per-point version."""
+    from app.geometry.cylinder import _compute_cylinder_frame, _compute_cylinder_frames
+
+    x_arc = np.array([-30.0, -2.5, 0.0, 12.25])
+    r_hats, t_hats, _, radius, circumference, thetas = _compute_cylinder_frames(x_arc, 30.75, 355.0)
+
+    assert r_hats.shape == t_hats.shape == (4, 3)
+    for i, x in enumerate(x_arc):
+        r_hat, t_hat, _, r, c, theta = _compute_cylinder_frame(x, 30.75, 355.0)
+        assert np.allclose(r_hats[i], r_hat)
+        assert np.allclose(t_hats[i], t_hat)
+        assert thetas[i] == pytest.approx(theta)
+    assert (radius, circumference) == (r, c)
+
+
+def test_disjoint_row_markers_are_concatenated():
+    """Counter plate row markers that cannot overlap are stacked without a boolean union."""
+    from app.geometry.braille_layout import create_card_line_end_marker_3d, create_card_triangle_marker_3d
+    from app.geometry.plates import _combine_row_markers, _row_markers_are_disjoint
+
+    settings = CardSettings()
+    assert _row_markers_are_disjoint(settings)
+    assert not _row_markers_are_disjoint(CardSettings(line_spacing=5.0, dot_spacing=3.0))
+
+    markers = [
+        create_card_line_end_marker_3d(10.0, 20.0, settings, height=0.5, for_subtraction=True),
+        create_card_triangle_marker_3d(16.5, 20.0, settings, height=0.5, for_subtraction=True),
+        create_card_triangle_marker_3d(16.5, 30.0, settings, height=0.5, for_subtraction=True),
+    ]
+    combined = _combine_row_markers(markers, settings)
+
+    assert len(combined.faces) == sum(len(m.faces) for m in markers)
+    assert combined.volume == pytest.approx(sum(m.volume for m in markers))
+    assert _combine_row_markers([], settings) is None
+
+
+def test_braille_dot_mask_matches_braille_to_dots():
+    """The vectorized decoder agrees with braille_to_dots, including blanks and invalid input."""
+    from app.geometry.braille_layout import braille_dot_mask
+    from app.utils import braille_to_dots
+
+    text = '⠁⠓ ⠿⠀⣿'
+    mask = braille_dot_mask(text)
+
+    assert mask.shape == (len(text), 6)
+    assert mask.tolist() == [[bool(d) for d in braille_to_dots(ch)] for ch in text]
+    assert braille_dot_mask('').shape == (0, 6)
+    with pytest.raises(ValueError, match='U\\+0058'):
+        braille_dot_mask('⠁X')
+
+
+def test_hole_disks_skip_union_only_when_disjoint():
+    """Counter plate holes are only unioned when the layout lets neighbouring holes overlap."""
+    from app.geometry.plates import _hole_disks
+
+    centers = np.array([[0.0, 0.0], [0.0, 2.5], [3.0, 0.0]])
+    disjoint = _hole_disks(centers, 1.0, CardSettings())
+    assert disjoint.geom_type == 'MultiPolygon'
+    assert len(disjoint.geoms) == 3
+
+    tight = CardSettings(dot_spacing=1.5)
+    overlapping = _hole_disks(np.array([[0.0, 0.0], [0.0, 1.5]]), 1.0, tight)
+    assert overlapping.is_valid
+    assert overlapping.geom_type == 'Polygon'
+
+
+def test_cylinder_shell_is_cached_but_returned_as_copy():
+    """Repeated shells share one extrusion, but callers get meshes they can modify freely."""
+    from app.geometry.cylinder import create_cylinder_shell
+
+    first = create_cylinder_shell(30.75, 52.0, 13.0, 12, align_vertex_theta_rad=0.25)
+    second = create_cylinder_shell(30.75, 52.0, 13.0, 12, align_vertex_theta_rad=0.25)
+
+    assert first is not second
+    assert first.is_watertight
+    assert first.bounds[0][2] == pytest.approx(-26.0)
+    first.apply_translation([0.0, 0.0, 26.0])
+    assert second.bounds[0][2] == pytest.approx(-26.0)
+
+
+def test_cylinder_dot_transform_matches_axis_angle_rotation():
+    """The closed-form dot placement equals a quarter turn about the tangent plus a radial offset."""
+    import trimesh
+
+    from app.geometry.cylinder import _compute_cylinder_frame, create_cylinder_braille_dot
+
+    settings = CardSettings()
+    r_hat, t_hat, _, radius, _, _ = _compute_cylinder_frame(7.5, 30.75, 20.0)
+    expected = create_braille_dot(0, 0, 0, settings)
+    expected.apply_transform(trimesh.transformations.rotation_matrix(np.pi / 2.0, t_hat))
+    expected.apply_translation(r_hat * (radius + settings.active_dot_height / 2.0) + [0.0, 0.0, 4.0])
+
+    dot = create_cylinder_braille_dot(7.5, 4.0, 0.0, settings, 30.75, 20.0)
+    assert np.allclose(dot.vertices, expected.vertices)
+
+
+def test_cone_recess_template_is_closed_frustum():
+    """The shared cone recess cutter is a closed frustum from z=0 down to the recess depth."""
+    from app.geometry.dot_shapes import cone_recess_template
+
+    frustum = cone_recess_template(0.8, 0.2, 0.85, 16)
+
+    assert frustum.is_volume
+    assert len(frustum.faces) == 4 * 16
+    assert frustum.bounds[0][2] == pytest.approx(-0.85)
+    assert frustum.bounds[1][2] == pytest.approx(0.0)
+    assert frustum.extents[0] == pytest.approx(1.6)
+
+
+def test_batched_cylinder_dots_match_single_dots():
+    """Placing all cylinder dots in one mesh gives the same vertices as placing them one by one."""
+    from app.geometry.cylinder import (
+        _compute_cylinder_frames,
+        _cylinder_dots_mesh,
+        create_cylinder_braille_dot,
+    )
+    from app.geometry.dot_shapes import braille_dot_template
+
+    settings = CardSettings()
+    x_arc = np.array([-12.0, 0.0, 9.5])
+    z_local = np.array([3.0, -4.0, 0.0])
+    r_hats, _, _, radius, _, _ = _compute_cylinder_frames(x_arc, 30.75)
+
+    batched = _cylinder_dots_mesh(braille_dot_template(settings), r_hats, z_local, radius, settings)
+    singles = [create_cylinder_braille_dot(x, z, 0.0, settings, 30.75) for x, z in zip(x_arc, z_local, strict=True)]
+
+    assert len(batched.faces) == sum(len(m.faces) for m in singles)
+    assert np.allclose(batched.vertices, np.vstack([m.vertices for m in singles]))
+
+
+@pytest.mark.parametrize('inward', [False, True])
+def test_marker_to_cylinder_matches_apply_transform(inward):
+    """Mapping a cached prism onto the cylinder equals copying it and applying the 4x4 transform."""
+    from app.geometry.cylinder import _column_frame, _local_marker_prism, _marker_to_cylinder
+
+    prism_local = _local_marker_prism('triangle', 2.5, 1.5, -0.5)
+    r_hat, t_hat, z_hat, radius, _, _ = _column_frame(10.0, 30.75, 0.0)
+    radial_axis = -r_hat if inward else r_hat
+    center_pos = r_hat * radius + z_hat * 3.0
+
+    expected = prism_local.copy()
+    transform = np.eye(4)
+    transform[:3, :3] = np.column_stack([t_hat, z_hat, radial_axis])
+    transform[:3, 3] = center_pos
+    expected.apply_transform(transform)
+
+    placed = _marker_to_cylinder(prism_local, r_hat, t_hat, z_hat, radial_axis, center_pos)
+    assert np.allclose(placed.vertices, expected.vertices)
+    assert np.array_equal(placed.faces, expected.faces)
+    assert placed.volume == pytest.approx(prism_local.volume)
+
+
+def test_cylinder_dot_offsets_follow_braille_numbering():
+    """Dots 1-3 run down the left column and dots 4-6 down the right, one dot spacing apart."""
+    from app.geometry.cylinder import _cylinder_dot_offsets
+
+    settings = CardSettings()
+    offsets = _cylinder_dot_offsets(settings, 30.75 / 2)
+
+    assert offsets.shape == (6, 2)
+    assert np.allclose(offsets[:, 0], np.repeat([-1.0, 1.0], 3) * settings.dot_spacing / 2)
+    assert np.allclose(offsets[:, 1], np.tile([1.0, 0.0, -1.0], 2) * settings.dot_spacing)
+
+
+def test_cylinder_rows_are_centered_vertically():
+    """Row centers are one line spacing apart with the dot content centered on the cylinder height."""
+    from app.geometry.cylinder import _row_center_ys
+
+    settings = CardSettings()
+    row_ys = _row_center_ys(settings, 52.0)
+
+    assert row_ys.shape == (settings.grid_rows,)
+    assert np.allclose(np.diff(row_ys), -settings.line_spacing)
+    top_dot = row_ys[0] + settings.dot_spacing - settings.braille_y_adjust
+    bottom_dot = row_ys[-1] - settings.dot_spacing - settings.braille_y_adjust
+    assert (top_dot + bottom_dot) / 2 == pytest.approx(26.0)
+
+
+def test_instance_meshes_place_independent_copies():
+    """Batched instancing returns one mesh per center without touching the shared template."""
+    import trimesh
+
+    from app.geometry.dot_shapes import instance_meshes
+
+    template = trimesh.creation.icosphere(subdivisions=1, radius=0.5)
+    original = template.vertices.copy()
+    centers = np.array([[1.0, 2.0, 3.0], [-4.0, 0.0, 0.5]])
+    quarter_turn = trimesh.transformations.rotation_matrix(np.pi / 2, [0, 0, 1])[:3, :3]
+
+    moved = instance_meshes(template, centers)
+    turned = instance_meshes(template, centers, np.stack([quarter_turn, np.eye(3)]))
+
+    assert [m.centroid.round(6).tolist() for m in moved] == centers.tolist()
+    assert np.allclose(turned[0].vertices, original @ quarter_turn.T + centers[0])
+    assert np.allclose(template.vertices, original)
+    moved[0].faces[0] = moved[0].faces[0][::-1]
+    assert not np.array_equal(template.faces[0], moved[0].faces[0])
+
+
+@pytest.mark.parametrize('indicator_shapes', [0, 1])
+def test_counter_dot_centers_cover_every_braille_cell(indicator_shapes):
+    """Universal counter plate recesses cover all six dots of each non-marker cell, row by row."""
+    from app.geometry.plates import _counter_dot_centers
+
+    settings = CardSettings(indicator_shapes=indicator_shapes)
+    centers = _counter_dot_centers(settings, 2.0)
+
+    reserved = 2 if indicator_shapes else 1
+    assert centers.shape == (settings.grid_rows * (settings.grid_columns - reserved) * 6, 3)
+    assert np.all(centers[:, 2] == 2.0)
+    first_cell_x = settings.left_margin + indicator_shapes * settings.cell_spacing + settings.braille_x_adjust
+    first_row_y = settings.card_height - settings.top_margin + settings.braille_y_adjust
+    assert centers[0, :2] == pytest.approx(
+        [first_cell_x - settings.dot_spacing / 2, first_row_y + settings.dot_spacing]
+    )
+    assert centers[5, :2] == pytest.approx(
+        [first_cell_x + settings.dot_spacing / 2, first_row_y - settings.dot_spacing]
+    )
+
+
+def test_disjoint_recesses_are_concatenated():
+    """Counter plate recess tools are only unioned when neighbouring recesses could overlap."""
+    import trimesh
+
+    from app.geometry.dot_shapes import instance_meshes
+    from app.geometry.plates import _combine_recesses
+
+    sphere = trimesh.creation.icosphere(subdivisions=1, radius=0.8)
+    spheres = instance_meshes(sphere, [(0.0, 0.0, 2.0), (2.5, 0.0, 2.0), (0.0, 10.0, 2.0)])
+
+    stacked = _combine_recesses(spheres, 0.8, CardSettings())
+    assert len(stacked.faces) == sum(len(m.faces) for m in spheres)
+    assert _combine_recesses(spheres[:1], 0.8, CardSettings()) is spheres[0]
+
+    overlapping = instance_meshes(sphere, [(0.0, 0.0, 2.0), (1.0, 0.0, 2.0)])
+    merged = _combine_recesses(overlapping, 0.8, CardSettings(dot_spacing=1.0))
+    assert merged.is_volume
+    assert merged.volume < sum(m.volume for m in overlapping)
+
+
+def test_manifold_difference_subtracts_every_cutter():
+    """The direct manifold3d batch difference removes all cutters and rejects broken inputs."""
+    pytest.importorskip('manifold3d')
+    import trimesh
+
+    from app.geometry.booleans import _manifold_boolean, is_manifold_result
+
+    plate = trimesh.creation.box(extents=(10.0, 10.0, 2.0))
+    cutters = [trimesh.creation.box(extents=(2.0, 2.0, 4.0)).apply_translation((x, 0.0, 0.0)) for x in (-3.0, 3.0)]
+
+    result = _manifold_boolean([plate] + cutters, 'difference')
+    assert result.is_volume
+    assert np.isclose(result.volume, 200.0 - 2 * 8.0)
+    assert is_manifold_result(result)
+    assert not is_manifold_result(plate)
+
+    open_box = trimesh.creation.box(extents=(1.0, 1.0, 1.0))
+    open_box.faces = open_box.faces[:-1]
+    with pytest.raises(ValueError):
+        _manifold_boolean([plate, open_box], 'difference')
+
+    inverted = cutters[0].copy()
+    inverted.invert()
+    with pytest.raises(ValueError):
+        _manifold_boolean([plate, inverted], 'difference')
+
+
+def test_pairwise_union_keeps_failed_pairs_separate():
+    """Fallback tool grouping unions what it can and never concatenates a tool it could not union."""
+    pytest.importorskip('manifold3d')
+    import trimesh
+
+    from app.geometry.booleans import pairwise_union
+
+    boxes = [trimesh.creation.box(extents=(2.0, 2.0, 2.0)).apply_translation((x, 0.0, 0.0)) for x in range(5)]
+    (merged,) = pairwise_union(boxes)
+    assert merged.is_volume
+    assert np.isclose(merged.volume, 6.0 * 4.0)
+
+    open_box = trimesh.creation.box(extents=(1.0, 1.0, 1.0))
+    open_box.faces = open_box.faces[:-1]
+    groups = pairwise_union(boxes[:2] + [open_box])
+    assert len(groups) == 2
+    assert any(g is open_box for g in groups)
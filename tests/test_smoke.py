@@ -12,7 +12,7 @@ from __future__ import annotations
 import pytest
 
 from app.models import CardSettings
-from app.utils import braille_to_dots
+from app.utils import braille_to_dots, has_braille_chars
 
 
 def _count_raised_dots(lines: list[str], max_cols: int | None = None) -> int:
@@ -36,6 +36,14 @@ def test_health_endpoint(client):
     assert 'status' in data
 
 
+def test_security_headers_present(client):
+    """Test that every response carries the security headers."""
+    response = client.get('/health')
+    assert "default-src 'self'" in response.headers['Content-Security-Policy']
+    assert response.headers['X-Content-Type-Options'] == 'nosniff'
+    assert response.headers['X-Frame-Options'] == 'DENY'
+
+
 def test_liblouis_tables_endpoint(client):
     """Test the /liblouis/tables endpoint returns table list."""
     response = client.get('/liblouis/tables')
@@ -192,6 +200,24 @@ def test_validation_invalid_shape_type(client):
     assert 'error' in data
 
 
+def test_validation_non_braille_characters(client):
+    """Test that untranslated text in a positive plate returns 400 with per-character details."""
+    payload = {
+        'lines': ['⠁a⠃ b', '', '', ''],
+        'plate_type': 'positive',
+        'shape_type': 'card',
+        'grade': 'g1',
+        'settings': {},
+    }
+
+    response = client.post('/geometry_spec', json=payload, headers={'Content-Type': 'application/json'})
+
+    assert response.status_code == 400
+    data = response.get_json()
+    assert 'error' in data
+    assert 'braille' in data['error'].lower()
+
+
 def test_validation_card_column_overflow(client):
     """
     SAFETY-CRITICAL: Test that card column overflow returns 400.
@@ -400,3 +426,23 @@ def test_braille_to_dots_braille_blank_pattern():
     # U+2800 is the "braille pattern blank" - a valid braille character with no dots
     result = braille_to_dots('⠀')
     assert result == [0, 0, 0, 0, 0, 0], f'Expected empty cell for ⠀ (U+2800), got {result}'
+
+
+def test_has_braille_chars_detects_braille_block():
+    """Lines count as braille when any character is in U+2800 to U+28FF."""
+    assert has_braille_chars('⠀')
+    assert has_braille_chars('ab ⣿')
+    assert not has_braille_chars('hello')
+    assert not has_braille_chars('\u27ff\u2900😀')
+    assert not has_braille_chars('')
+
+
+def test_card_settings_legacy_recess_parameters():
+    """Legacy recessed/counter-plate dot sizes are derived from emboss dims plus the plate offset."""
+    settings = CardSettings(emboss_dot_base_diameter=2.0, emboss_dot_flat_hat=0.5, negative_plate_offset=0.3)
+
+    assert settings.recessed_dot_base_diameter == pytest.approx(2.6)
+    assert settings.recessed_dot_top_diameter == pytest.approx(1.1)
+    assert settings.recessed_dot_height == pytest.approx(settings.emboss_dot_height + 0.3)
+    assert settings.counter_plate_dot_base_diameter == settings.recessed_dot_base_diameter
+    assert settings.counter_plate_dot_height == settings.recessed_dot_height